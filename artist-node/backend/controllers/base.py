@@ -1,11 +1,33 @@
-from quart import current_app
+import json
+from typing import Any
+
+from quart import Response, current_app
 from quart.views import MethodView
 from backend.graph.graph_ops import GraphOps
 
+try:
+  import orjson
+except ImportError:  # pragma: no cover - optional speedup
+  orjson = None
+
 
 class ArtistServerControllerBase(MethodView):
   """Base class for all artist server controllers."""
 
   def get_graph_ops(self) -> GraphOps:
     """Get the GraphOps instance from the current app config."""
-    return current_app.config["GRAPH_OPS"]
\ No newline at end of file
+    return current_app.config["GRAPH_OPS"]
+
+  @staticmethod
+  def json_response(payload: Any, status: int = 200) -> Response:
+    """
+    Serialize a payload straight to bytes, using orjson when available.
+
+    Skips jsonify's app/context machinery and (with orjson) the slower
+    stdlib encoder on the hot API paths.
+    """
+    if orjson is not None:
+      body = orjson.dumps(payload)
+    else:
+      body = json.dumps(payload)
+    return Response(body, status=status, mimetype="application/json")
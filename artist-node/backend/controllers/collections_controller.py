@@ -1,4 +1,6 @@
-from quart import request, Blueprint, jsonify
+import asyncio
+
+from quart import request, Blueprint
 
 from backend.controllers.base import ArtistServerControllerBase
 
@@ -21,11 +23,13 @@ class CollectionsController(ArtistServerControllerBase):
       - limit: optional hard cap (int)
       - card: optional (e.g. "artist")
       - mode: optional layout mode hint (grid|list|carousel)
+      - cursor: optional keyset cursor (path of the last item seen);
+        overrides page when present, echoed back as next_cursor
     """
     source = request.args.get("source", "folder")
     path = request.args.get("path")
     if not path:
-      return jsonify({"error": "Missing required query param: path"}), 400
+      return self.json_response({"error": "Missing required query param: path"}, status=400)
 
     # paging
     try:
@@ -54,7 +58,13 @@ class CollectionsController(ArtistServerControllerBase):
     mode = request.args.get("mode")  # grid|list|carousel
     layout = {"mode": mode} if mode else None
 
-    payload = self.get_graph_ops().get_collection(
+    # keyset paging (optional)
+    cursor = request.args.get("cursor")
+
+    # Resolution is synchronous work; run it off the event loop so a
+    # large collection build doesn't stall other in-flight requests.
+    payload = await asyncio.to_thread(
+      self.get_graph_ops().get_collection,
       source=source,
       path=path,
       page=page,
@@ -63,12 +73,13 @@ class CollectionsController(ArtistServerControllerBase):
       limit=limit,
       card=card,
       layout=layout,
+      cursor=cursor,
     )
 
     if payload is None:
-      return jsonify({"error": "Not found"}), 404
+      return self.json_response({"error": "Not found"}, status=404)
 
-    return jsonify(payload)
+    return self.json_response(payload)
 
 
 # Register the view
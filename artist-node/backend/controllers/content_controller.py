@@ -1,10 +1,56 @@
 # backend/controllers/content_controller.py
+import mimetypes
+import os
+import re
+import stat
+
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
-from quart import Blueprint, current_app, send_from_directory, abort
+from quart import Blueprint, Response, current_app, request, send_file, abort
 from quart.views import MethodView
 
 content_bp = Blueprint("content", __name__)
 
+# Content assets are immutable-ish media (audio, artwork); let browsers and
+# CDNs hold them for a day and revalidate with the ETag after that.
+CACHE_CONTROL = "public, max-age=86400"
+
+# Absolute paths, ".." components, and NUL bytes are the ways a request
+# path can escape content_root *lexically*; one O(len) scan catches them
+# all. Symlinks can still escape physically, which is why the fast path
+# below is limited to subtrees proven symlink-free at boot.
+_UNSAFE_PATH = re.compile(r"(^/|(^|/)\.\.(/|$)|\x00)")
+
+
+def scan_symlink_free_prefixes(content_root: Path) -> frozenset:
+  """
+  One boot-time walk over content_root recording which top-level
+  subtrees contain no symlinks. Requests into those subtrees need only
+  the lexical check above and skip resolve()'s per-component
+  lstat/readlink chain; everything else falls back to the full
+  canonicalizing check.
+  """
+  root_str = str(content_root)
+  cut = len(root_str) + 1
+  prefixes: set = set()
+  tainted: set = set()
+  try:
+    for dirpath, dirnames, filenames in os.walk(root_str):
+      rel = dirpath[cut:]
+      top = rel.replace(os.sep, "/").split("/", 1)[0] if rel else None
+      if top is None:
+        prefixes.update(dirnames)
+      for name in dirnames + filenames:
+        if os.path.islink(os.path.join(dirpath, name)):
+          tainted.add(top if top is not None else name)
+  except OSError:
+    return frozenset()
+  return frozenset(prefixes - tainted)
+
+
+def _etag_for(st: os.stat_result) -> str:
+  return f'"{st.st_ino:x}-{st.st_size:x}-{int(st.st_mtime):x}"'
+
 
 class ContentController(MethodView):
   """Controller for serving static content assets (audio, images, etc.)."""
@@ -16,20 +62,69 @@ class ContentController(MethodView):
          /content/assets/backgrounds/starfield_1.jpg
     """
     content_root: Path = current_app.config["CONTENT_ROOT"]
-    
-    # Security: resolve the path and ensure it's within content_root
-    requested_path = (content_root / filepath).resolve()
-    if not str(requested_path).startswith(str(content_root)):
+    content_root_str: str = current_app.config["CONTENT_ROOT_STR"]
+
+    # Security: keep requests inside content_root. The lexical scan
+    # rejects absolute paths / ".." / NUL outright; after that, paths
+    # into subtrees proven symlink-free at boot skip resolve()'s
+    # per-component lstat/readlink chain, and anything else gets the
+    # full canonicalizing check.
+    if _UNSAFE_PATH.search(filepath):
       abort(403)  # Forbidden - path traversal attempt
-    
-    if not requested_path.exists() or not requested_path.is_file():
+    top = filepath.partition("/")[0]
+    if top in current_app.config["SYMLINK_FREE_PREFIXES"]:
+      requested_path = content_root / filepath
+    else:
+      requested_path = (content_root / filepath).resolve()
+      if not str(requested_path).startswith(content_root_str + os.sep):
+        abort(403)  # Forbidden - symlink escaped the content tree
+
+    # Single stat for existence + type + the conditional-GET validators.
+    try:
+      st = os.stat(requested_path)
+    except (OSError, ValueError):
+      abort(404)
+    if not stat.S_ISREG(st.st_mode):
       abort(404)
-    
-    # Serve the file from its parent directory
-    return await send_from_directory(
-      requested_path.parent,
-      requested_path.name
+
+    etag = _etag_for(st)
+
+    # Conditional GET: a cache hit skips the whole file transfer.
+    if request.headers.get("If-None-Match") == etag:
+      return Response(
+        "", status=304,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+      )
+
+    if_modified_since = request.headers.get("If-Modified-Since")
+    if if_modified_since:
+      try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+        if int(st.st_mtime) <= since:
+          return Response(
+            "", status=304,
+            headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+          )
+      except (TypeError, ValueError):
+        pass  # unparsable header; serve the full response
+
+    # Serve the resolved file directly - no second directory join / safety
+    # re-check like send_from_directory does. Guess the mimetype once up
+    # front so large media (mp3s, images) gets the right Content-Type.
+    mimetype, _ = mimetypes.guess_type(requested_path.name)
+    response = await send_file(
+      requested_path,
+      mimetype=mimetype or "application/octet-stream",
+      conditional=True,
     )
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    response.headers["Last-Modified"] = formatdate(st.st_mtime, usegmt=True)
+    # conditional=True lets send_file answer Range: bytes=X-Y seeks with a
+    # 206 Partial Content; advertise that so audio players scrub instead
+    # of re-downloading whole tracks.
+    response.headers["Accept-Ranges"] = "bytes"
+    return response
 
 
 # Register the view with route parameter
@@ -37,4 +132,3 @@ content_bp.add_url_rule(
   "/content/<path:filepath>",
   view_func=ContentController.as_view("content")
 )
-
@@ -1,5 +1,5 @@
 # backend/controllers/nav_controller.py
-from quart import Blueprint, jsonify
+from quart import Blueprint, Response
 
 from backend.controllers.base import ArtistServerControllerBase
 
@@ -12,8 +12,9 @@ class NavController(ArtistServerControllerBase):
   async def get(self):
     """GET /api/nav - Returns navigation structure."""
     ops = self.get_graph_ops()
-    nav_data = ops.get_nav()
-    return jsonify(nav_data)
+    # Nav is static per process, so serve the memoized serialized body;
+    # concurrent cold-start requests coalesce onto a single build.
+    return Response(await ops.get_nav_json_async(), mimetype="application/json")
 
 # Register the view
-nav_bp.add_url_rule("/api/nav", view_func=NavController.as_view("nav"))
\ No newline at end of file
+nav_bp.add_url_rule("/api/nav", view_func=NavController.as_view("nav"))
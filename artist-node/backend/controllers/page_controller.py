@@ -1,4 +1,4 @@
-from quart import request, Blueprint, jsonify
+from quart import request, Blueprint, Response
 
 from backend.controllers.base import ArtistServerControllerBase
 
@@ -11,12 +11,13 @@ class PageController(ArtistServerControllerBase):
   async def get(self):
     """GET /api/page - Returns page content."""
     path = request.args.get("path")  # e.g. "artists/zol"
-    payload = self.get_graph_ops().get_page(path)
+    body = self.get_graph_ops().get_page_json(path)
 
-    if payload is None:
-      return jsonify({"error": "Not found"}), 404
+    if body is None:
+      return self.json_response({"error": "Not found"}, status=404)
 
-    return jsonify(payload)
+    # Pre-serialized by the graph's per-path JSON cache.
+    return Response(body, mimetype="application/json")
 
 
 # Register the view
@@ -1,5 +1,9 @@
 # backend/graph/graph_ops.py
 
+import asyncio
+import json
+import logging
+
 from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional, Iterable, Union, Set
 
@@ -10,12 +14,35 @@ from backend.models.blocks import SubpageBlock, SectionBlock
 
 BlockLike = Union[SubpageBlock, SectionBlock, Dict[str, Any]]
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class GraphOps:
   graph: ContentGraph
   nav_config: Dict[str, Any] = field(default_factory=dict)
 
+  # Memoized nav payload + its serialized form. The graph and nav config
+  # are immutable after startup, so the nav only needs to be built once.
+  _nav_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+  _nav_json_cache: Optional[str] = field(default=None, init=False, repr=False)
+
+  # Memoized auto_children subtrees keyed on node path, so each node's nav
+  # children are built exactly once per process even when several nav
+  # entries (or nested subpages) reach the same node.
+  _nav_subtree_cache: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict, init=False, repr=False)
+
+  # Singleflight guard for the first nav build: concurrent cold-start
+  # requests coalesce onto one build instead of each walking the graph.
+  _nav_build_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
+
+  # Bounded memo of collection payloads keyed on normalized query params.
+  # The graph is immutable per process, so identical queries can share one
+  # resolve/sort/paginate pass.
+  _collection_cache: Dict[tuple, Dict[str, Any]] = field(default_factory=dict, init=False, repr=False)
+
+  _COLLECTION_CACHE_MAX = 1024
+
   @classmethod
   def from_graph(
     cls,
@@ -35,10 +62,10 @@ class GraphOps:
       path = ref
 
     if self.graph.get_node(path) is None:
-      print(f"DEBUG _resolve_ref: ref='{ref}' -> path='{path}' (NOT FOUND)")
+      logger.debug("resolve_ref %r -> %r (not found)", ref, path)
       return None
 
-    print(f"DEBUG _resolve_ref: ref='{ref}' -> path='{path}'")
+    logger.debug("resolve_ref %r -> %r", ref, path)
     return path
 
   def _href_for_path(self, path: str) -> str:
@@ -46,28 +73,19 @@ class GraphOps:
       return "/"
     return "/" + path
 
-  def _iter_nav_subpages(self, blocks: Iterable[BlockLike]) -> Iterable[BlockLike]:
+  def _iter_nav_subpages(self, blocks: Iterable[BlockLike]) -> Iterable[SubpageBlock]:
+    # Blocks are always dataclasses after ContentGraph.from_dict /
+    # builder parsing, so this is a tight type-tag loop with no
+    # getattr/isinstance polymorphism.
     for block in blocks:
-      btype = getattr(block, "type", None)
-      if btype is None and isinstance(block, dict):
-        btype = block.get("type")
+      btype = block.type
 
       if btype == "subpage":
-        nav_flag = getattr(block, "nav", None)
-        if nav_flag is None and isinstance(block, dict):
-          nav_flag = block.get("nav", False)
-
-        if nav_flag:
+        if block.nav:
           yield block
 
       elif btype == "section":
-        if isinstance(block, SectionBlock):
-          inner = block.blocks
-        elif isinstance(block, dict):
-          inner = block.get("blocks", []) or []
-        else:
-          inner = []
-
+        inner = block.blocks
         if inner:
           yield from self._iter_nav_subpages(inner)
 
@@ -77,6 +95,10 @@ class GraphOps:
     node: ContentNode,
     visited: Optional[Set[str]] = None,
   ) -> List[Dict[str, Any]]:
+    cached = self._nav_subtree_cache.get(node.meta.path)
+    if cached is not None:
+      return cached  # read-only downstream, safe to share
+
     if visited is None:
       visited = set()
 
@@ -87,13 +109,8 @@ class GraphOps:
     children: List[Dict[str, Any]] = []
 
     for block in self._iter_nav_subpages(node.content):
-      # dataclass vs dict support
-      if isinstance(block, SubpageBlock):
-        ref_path = block.ref
-        label = block.label
-      else:  # dict
-        ref_path = block.get("ref")
-        label = block.get("label")
+      ref_path = block.ref
+      label = block.label
 
       if not ref_path:
         continue
@@ -112,12 +129,13 @@ class GraphOps:
 
       child = {
         "label": effective_label,
-        "href": self._href_for_path(target.meta.path),
+        "href": target.meta.href or self._href_for_path(target.meta.path),
         # recursion: allow 3rd, 4th, ... levels
         "children": self._build_nav_tree_for_node(target, visited),
       }
       children.append(child)
 
+    self._nav_subtree_cache[node.meta.path] = children
     return children
 
   def _nav_item_from_entry(self, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -140,7 +158,7 @@ class GraphOps:
       or node.meta.path
     )
 
-    href = self._href_for_path(node.meta.path)
+    href = node.meta.href or self._href_for_path(node.meta.path)
 
     if entry.get("auto_children") == "from_subpages":
       children = self._build_nav_tree_for_node(node)
@@ -154,12 +172,33 @@ class GraphOps:
     }
 
   def get_nav(self) -> Dict[str, Any]:
-    items: List[Dict[str, Any]] = []
-    for entry in self.nav_config.get("items", []):
-      item = self._nav_item_from_entry(entry)
-      if item:
-        items.append(item)
-    return {"items": items}
+    if self._nav_cache is None:
+      items: List[Dict[str, Any]] = []
+      for entry in self.nav_config.get("items", []):
+        item = self._nav_item_from_entry(entry)
+        if item:
+          items.append(item)
+      self._nav_cache = {"items": items}
+    return self._nav_cache
+
+  def get_nav_json(self) -> str:
+    """Serialized form of get_nav(), memoized alongside the payload."""
+    if self._nav_json_cache is None:
+      self._nav_json_cache = json.dumps(self.get_nav())
+    return self._nav_json_cache
+
+  async def get_nav_json_async(self) -> str:
+    """
+    Awaitable wrapper around get_nav_json with singleflight semantics:
+    the first caller builds (off the event loop), everyone else awaits the
+    same result. Cache hits skip the lock entirely.
+    """
+    if self._nav_json_cache is not None:
+      return self._nav_json_cache
+    async with self._nav_build_lock:
+      if self._nav_json_cache is None:
+        await asyncio.to_thread(self.get_nav_json)
+    return self._nav_json_cache
 
   def get_page(self, path: Optional[str]) -> Optional[Dict[str, Any]]:
     """
@@ -173,6 +212,13 @@ class GraphOps:
 
     return self.graph.to_page_payload(path)
 
+  def get_page_json(self, path: Optional[str]) -> Optional[bytes]:
+    """Like get_page, but returns cached pre-serialized JSON bytes."""
+    if not path:
+      path = self.graph.root_content_path
+
+    return self.graph.to_page_payload_json(path)
+
   def get_collection(
     self,
     *,
@@ -184,6 +230,7 @@ class GraphOps:
     limit: Optional[int] = None,
     card: Optional[str] = None,
     layout: Optional[Dict[str, Any]] = None,
+    cursor: Optional[str] = None,
   ) -> Optional[Dict[str, Any]]:
     """
     Return a collection payload.
@@ -209,7 +256,26 @@ class GraphOps:
     if page_size < 1:
       page_size = 24
 
-    return self.graph.get_collection_payload(
+    # Cache on normalized params (layout is only a mode hint, so freeze
+    # that). Random sorts must stay fresh per request.
+    cacheable = sort != "random"
+    if cacheable:
+      cache_key = (
+        source or "folder",
+        path,
+        page,
+        page_size,
+        sort,
+        limit,
+        card,
+        (layout or {}).get("mode"),
+        cursor,
+      )
+      cached = self._collection_cache.get(cache_key)
+      if cached is not None:
+        return cached
+
+    payload = self.graph.get_collection_payload(
       source=source or "folder",
       path=path,
       page=page,
@@ -218,5 +284,13 @@ class GraphOps:
       limit=limit,
       card=card,
       layout=layout,
+      cursor=cursor,
       current_node_path=self.graph.root_content_path,
     )
+
+    if cacheable and payload is not None:
+      if len(self._collection_cache) >= self._COLLECTION_CACHE_MAX:
+        self._collection_cache.clear()
+      self._collection_cache[cache_key] = payload
+
+    return payload
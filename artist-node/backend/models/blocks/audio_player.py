@@ -3,15 +3,19 @@ from dataclasses import dataclass
 from typing import Dict, Optional, Literal, Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VisualizerConfig:
   """Configuration for an audio visualizer."""
   type: Literal["p5"] = "p5"
   id: str = "spectrum-bars"  # registered sigil ID
   options: Optional[Dict[str, Any]] = None  # sensitivity, barCount, mirrorMode, etc.
 
+  def to_dict(self) -> Dict[str, Any]:
+    """Flat dict walker - avoids asdict's deepcopy/recursion overhead."""
+    return {"type": self.type, "id": self.id, "options": self.options}
 
-@dataclass
+
+@dataclass(slots=True)
 class AudioPlayerBlock:
   """Audio player with optional visualizer."""
   type: Literal["audio_player"] = "audio_player"
@@ -21,3 +25,14 @@ class AudioPlayerBlock:
   artwork: Optional[str] = None              # cover art path
   visualizer: Optional[VisualizerConfig] = None  # optional visualizer config
 
+  def to_dict(self) -> Dict[str, Any]:
+    """Serialize like asdict, but with a hand-written walker."""
+    return {
+      "type": self.type,
+      "src": self.src,
+      "title": self.title,
+      "artist": self.artist,
+      "artwork": self.artwork,
+      "visualizer": self.visualizer.to_dict() if self.visualizer else None,
+    }
+
@@ -1,5 +1,5 @@
 """Collection block for displaying lists of items."""
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Dict, List, Optional, Literal, Any
 
 
@@ -7,7 +7,7 @@ CollectionLayoutMode = Literal["grid", "list", "carousel"]
 CollectionPagingMode = Literal["load_more", "pages"]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CollectionLayout:
   """
   Layout configuration for collection blocks.
@@ -42,8 +42,12 @@ class CollectionLayout:
   snap_align: Optional[str] = None                  # "start" | "center"
   max_width: Optional[str] = None                   # e.g. "100%", "1200px"
 
+  def to_dict(self) -> Dict[str, Any]:
+    """Flat dict walker - avoids asdict's deepcopy/recursion overhead."""
+    return {name: getattr(self, name) for name in _LAYOUT_FIELD_NAMES}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CollectionPaging:
   """
   Paging configuration for a collection block.
@@ -55,8 +59,12 @@ class CollectionPaging:
   page_size: Optional[int] = None                 # items per page (if None, treat as "all")
   mode: CollectionPagingMode = "load_more"        # "load_more" | "pages"
 
+  def to_dict(self) -> Dict[str, Any]:
+    """Flat dict walker - avoids asdict's deepcopy/recursion overhead."""
+    return {"enabled": self.enabled, "page_size": self.page_size, "mode": self.mode}
+
 
-@dataclass
+@dataclass(slots=True)
 class CollectionBlock:
   type: Literal["collection"] = "collection"
 
@@ -80,3 +88,24 @@ class CollectionBlock:
   # UX when empty
   empty_state: Optional[Dict[str, str]] = None  # { "heading": "...", "body": "..." }
 
+  def to_dict(self) -> Dict[str, Any]:
+    """Serialize like asdict, but with a hand-written walker."""
+    return {
+      "type": self.type,
+      "source": self.source,
+      "path": self.path,
+      "layout": self.layout.to_dict() if self.layout else None,
+      "card": self.card,
+      "sort": self.sort,
+      "sort_options": self.sort_options,
+      "limit": self.limit,
+      "filters": self.filters,
+      "paging": self.paging.to_dict() if self.paging else None,
+      "empty_state": self.empty_state,
+    }
+
+
+# Field name tuple computed once at import; the layout has enough knobs
+# that a generated walker beats spelling them out.
+_LAYOUT_FIELD_NAMES = tuple(f.name for f in fields(CollectionLayout))
+
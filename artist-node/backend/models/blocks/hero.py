@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Dict, Optional, Literal, Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SigilConfig:
   """Configuration for a visual sigil (p5.js sketch or static image)."""
   type: Literal["p5", "image"] = "p5"
@@ -14,8 +14,18 @@ class SigilConfig:
   alt: Optional[str] = None          # accessibility alt text
   options: Optional[Dict[str, Any]] = None  # p5 sigil options (seed, variant, etc.)
 
+  def to_dict(self) -> Dict[str, Any]:
+    """Flat dict walker - avoids asdict's deepcopy/recursion overhead."""
+    return {
+      "type": self.type,
+      "id": self.id,
+      "src": self.src,
+      "alt": self.alt,
+      "options": self.options,
+    }
 
-@dataclass
+
+@dataclass(slots=True)
 class HeroBlock:
   type: Literal["hero"] = "hero"
   heading: str = ""
@@ -25,3 +35,15 @@ class HeroBlock:
   sigil: Optional[SigilConfig] = None   # animated or static visual sigil
   background: Optional[str] = None      # background image path
 
+  def to_dict(self) -> Dict[str, Any]:
+    """Serialize like asdict, but with a hand-written walker."""
+    return {
+      "type": self.type,
+      "heading": self.heading,
+      "subheading": self.subheading,
+      "body": self.body,
+      "cta": self.cta,
+      "sigil": self.sigil.to_dict() if self.sigil else None,
+      "background": self.background,
+    }
+
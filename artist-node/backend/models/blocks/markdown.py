@@ -1,10 +1,14 @@
 """Markdown content block."""
 from dataclasses import dataclass
-from typing import Literal
+from typing import Any, Dict, Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class MarkdownBlock:
   type: Literal["markdown"] = "markdown"
   body: str = ""
 
+  def to_dict(self) -> Dict[str, Any]:
+    """Flat dict walker - avoids asdict's deepcopy/recursion overhead."""
+    return {"type": self.type, "body": self.body}
+
@@ -8,7 +8,7 @@ if TYPE_CHECKING:
   from backend.models.blocks import Block
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionBlock:
   type: Literal["section"] = "section"
   id: Optional[str] = None
@@ -16,3 +16,13 @@ class SectionBlock:
   blocks: List["Block"] = field(default_factory=list)
   align: Optional[Dict[str, Any]] = None  # { horizontal: "left"|"center"|"right", vertical: "start"|"center"|"end" }
 
+  def to_dict(self) -> Dict[str, Any]:
+    """Serialize like asdict, but with a hand-written walker."""
+    return {
+      "type": self.type,
+      "id": self.id,
+      "label": self.label,
+      "blocks": [b.to_dict() for b in self.blocks],
+      "align": self.align,
+    }
+
@@ -1,12 +1,16 @@
 """Subpage reference block."""
 from dataclasses import dataclass
-from typing import Optional, Literal
+from typing import Any, Dict, Optional, Literal
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SubpageBlock:
   type: Literal["subpage"] = "subpage"
   ref: str = ""          # relative node path, e.g. "music/albums"
   label: Optional[str] = None
   nav: bool = False      # opt into navbar dropdowns
 
+  def to_dict(self) -> Dict[str, Any]:
+    """Flat dict walker - avoids asdict's deepcopy/recursion overhead."""
+    return {"type": self.type, "ref": self.ref, "label": self.label, "nav": self.nav}
+
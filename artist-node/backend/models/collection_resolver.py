@@ -1,16 +1,72 @@
 """Collection resolution, sorting, and pagination logic."""
 from __future__ import annotations
 
-from dataclasses import asdict
-from typing import Dict, List, Optional, Any, TYPE_CHECKING
+import bisect
+import random
+import sys
+
+from typing import Dict, List, Optional, Any, Sequence, TYPE_CHECKING
 
 from backend.models.blocks import CollectionBlock, CollectionLayout, CollectionPaging
-from backend.models.defaults import DEFAULT_COLLECTION_LAYOUTS, _deep_merge
+from backend.models.defaults import DEFAULT_COLLECTION_LAYOUTS, merge_layout_defaults
 
 if TYPE_CHECKING:
   from backend.models.content_graph import ContentGraph
 
 
+# Interned constants for the strings repeated in every payload - cheaper
+# allocation and pointer-equal keys for downstream JSON encoding.
+_COLLECTION = sys.intern("collection")
+_FOLDER = sys.intern("folder")
+_LOAD_MORE = sys.intern("load_more")
+_GRID = sys.intern("grid")
+
+# Empty collections all produce the same paging metadata for a given
+# (enabled, mode, page, page_size), so hand out prebuilt dicts for them.
+# page/page_size come straight from the query string, so the key space is
+# request-controlled - capped and cleared when full like the graph caches.
+_EMPTY_PAGING_CACHE: Dict[tuple, Dict[str, Any]] = {}
+_EMPTY_PAGING_CACHE_MAX = 1024
+
+
+def _paging_dict(
+  *,
+  page: int,
+  page_size: Optional[int],
+  total_items: int,
+  mode: str = _LOAD_MORE,
+  enabled: bool = True,
+) -> Dict[str, Any]:
+  """Build the paging metadata dict shared by every collection payload."""
+  if total_items == 0:
+    key = (enabled, mode, page, page_size)
+    cached = _EMPTY_PAGING_CACHE.get(key)
+    if cached is not None:
+      return cached
+
+  if page_size:
+    total_pages = (total_items + page_size - 1) // page_size
+    has_more = page * page_size < total_items
+  else:
+    total_pages = 1
+    has_more = False
+
+  paging = {
+    "enabled": enabled,
+    "mode": mode,
+    "page": page,
+    "page_size": page_size,
+    "total_items": total_items,
+    "total_pages": total_pages,
+    "has_more": has_more,
+  }
+  if total_items == 0:
+    if len(_EMPTY_PAGING_CACHE) >= _EMPTY_PAGING_CACHE_MAX:
+      _EMPTY_PAGING_CACHE.clear()
+    _EMPTY_PAGING_CACHE[key] = paging
+  return paging
+
+
 class CollectionResolver:
   """
   Handles collection resolution, sorting, and pagination.
@@ -19,8 +75,15 @@ class CollectionResolver:
   to add new collection sources (roster, tags, queries) without bloating the graph class.
   """
   
+  # Cap on the hydrated-block memo below; cleared wholesale when full.
+  _HYDRATED_CACHE_MAX = 256
+
   def __init__(self, graph: "ContentGraph"):
     self.graph = graph
+    # Hydrated page-1 payloads keyed on (block identity, current node).
+    # Blocks live as long as the graph, and the graph is immutable per
+    # process, so identity is a stable key.
+    self._hydrated_cache: Dict[tuple, Dict[str, Any]] = {}
   
   def resolve_collection(
     self,
@@ -33,12 +96,16 @@ class CollectionResolver:
     limit: Optional[int] = None,
     layout: Optional[Dict[str, Any]] = None,
     card: Optional[str] = None,
+    cursor: Optional[str] = None,
     current_node_path: str = "server",
   ) -> Dict[str, Any]:
     """
     Resolve + paginate a collection and return a frontend-friendly payload.
-    
+
     This is the main entry point for the /api/collection endpoint.
+    Paging is either page/page_size (offset) or keyset via `cursor`, the
+    path of the last item on the previous page; cursor paging costs
+    O(page_size) per request regardless of how deep the caller is.
     """
     # Normalize
     page = max(1, int(page or 1))
@@ -46,7 +113,7 @@ class CollectionResolver:
 
     # Build a temporary CollectionBlock (so we can reuse logic cleanly)
     temp_block = CollectionBlock(
-      source=source or "folder",
+      source=source or _FOLDER,
       path=path,
       sort=sort,
       limit=limit,
@@ -57,46 +124,51 @@ class CollectionResolver:
 
     # Merge layout defaults
     layout_dict = layout or {}
-    mode = (layout_dict.get("mode") or "grid")
-    defaults = DEFAULT_COLLECTION_LAYOUTS.get(mode, DEFAULT_COLLECTION_LAYOUTS["grid"])
-    merged_layout = _deep_merge(defaults, layout_dict)
+    mode = (layout_dict.get("mode") or _GRID)
+    defaults = DEFAULT_COLLECTION_LAYOUTS.get(mode, DEFAULT_COLLECTION_LAYOUTS[_GRID])
+    merged_layout = merge_layout_defaults(defaults, layout_dict)
 
     # Resolve candidates
     candidates = self._resolve_candidates(temp_block, current_node_path=current_node_path)
 
     # Sort + limit
-    candidates = self._apply_sort(candidates, sort=sort)
+    candidates = self._apply_sort(candidates, sort=sort, parent=self._sort_parent(temp_block))
 
     if isinstance(limit, int) and limit > 0:
       candidates = candidates[:limit]
 
     total_items = len(candidates)
-    total_pages = (total_items + page_size - 1) // page_size if page_size else 1
 
     # Slice for current page
-    start = (page - 1) * page_size
+    if cursor is not None and sort != "random":
+      # Keyset: seek just past the cursor item instead of trusting an
+      # offset that shifts as the collection grows.
+      start = self._cursor_start(candidates, cursor, sort)
+      page = start // page_size + 1
+    else:
+      start = (page - 1) * page_size
     end = start + page_size
-    page_paths = candidates[start:end]
+    if sort == "random":
+      # Seed per (path, page) so repeat requests for the same page are
+      # stable within a process.
+      page_paths = self._sample_page(candidates, page_size, seed=hash((path, page)))
+    else:
+      page_paths = candidates[start:end]
 
-    items = [self._item_payload(p) for p in page_paths]
+    # Single locals-bound dict for the page's node lookups.
+    nodes = self.graph.nodes
+    items = [self._item_payload(p, nodes.get(p)) for p in page_paths]
 
     return {
-      "type": "collection",
-      "source": source or "folder",
+      "type": _COLLECTION,
+      "source": source or _FOLDER,
       "path": path,
       "card": card,
       "sort": sort,
       "layout": merged_layout,
       "items": items,
-      "paging": {
-        "enabled": True,
-        "mode": "load_more",
-        "page": page,
-        "page_size": page_size,
-        "total_items": total_items,
-        "total_pages": total_pages,
-        "has_more": end < total_items,
-      },
+      "next_cursor": page_paths[-1] if page_paths and end < total_items else None,
+      "paging": _paging_dict(page=page, page_size=page_size, total_items=total_items),
     }
   
   def hydrate_collection_block(
@@ -109,19 +181,26 @@ class CollectionResolver:
     
     Used when hydrating a page payload that contains collection blocks.
     """
-    data = asdict(block)
+    cacheable = block.sort != "random"
+    cache_key = (id(block), current_node_path)
+    if cacheable:
+      cached = self._hydrated_cache.get(cache_key)
+      if cached is not None:
+        return cached
+
+    data = block.to_dict()
 
     # ---- 1) Merge layout defaults (backend owns defaults) ----
-    layout_dict = asdict(block.layout) if block.layout else {}
-    mode = (layout_dict.get("mode") or "grid")
-    defaults = DEFAULT_COLLECTION_LAYOUTS.get(mode, DEFAULT_COLLECTION_LAYOUTS["grid"])
-    data["layout"] = _deep_merge(defaults, layout_dict)
+    layout_dict = block.layout.to_dict() if block.layout else {}
+    mode = (layout_dict.get("mode") or _GRID)
+    defaults = DEFAULT_COLLECTION_LAYOUTS.get(mode, DEFAULT_COLLECTION_LAYOUTS[_GRID])
+    data["layout"] = merge_layout_defaults(defaults, layout_dict)
 
     # ---- 2) Resolve candidate node paths ----
     candidates = self._resolve_candidates(block, current_node_path=current_node_path)
 
     # ---- 3) Apply sort + limit ----
-    candidates = self._apply_sort(candidates, sort=block.sort)
+    candidates = self._apply_sort(candidates, sort=block.sort, parent=self._sort_parent(block))
 
     if isinstance(block.limit, int) and block.limit > 0:
       candidates = candidates[:block.limit]
@@ -129,7 +208,7 @@ class CollectionResolver:
     total_items = len(candidates)
 
     # ---- 4) Paging (page 1 only for now) ----
-    paging_cfg = asdict(block.paging) if block.paging else {}
+    paging_cfg = block.paging.to_dict() if block.paging else {}
     paging_enabled = bool(paging_cfg.get("enabled", False))
 
     page_size = paging_cfg.get("page_size")
@@ -144,25 +223,28 @@ class CollectionResolver:
     start = 0
     end = start + (page_size or 0)
 
-    page_paths = candidates[start:end] if page_size else []
+    if block.sort == "random":
+      page_paths = self._sample_page(candidates, page_size or 0)
+    else:
+      page_paths = candidates[start:end] if page_size else []
 
     # ---- 5) Attach items payloads ----
-    data["items"] = [self._item_payload(p) for p in page_paths]
+    nodes = self.graph.nodes
+    data["items"] = [self._item_payload(p, nodes.get(p)) for p in page_paths]
 
     # ---- 6) Attach paging metadata (so UI can show Load More / page numbers) ----
-    total_pages = 1
-    if page_size and page_size > 0:
-      total_pages = (total_items + page_size - 1) // page_size
-
-    data["paging"] = {
-      "enabled": paging_enabled,
-      "mode": paging_cfg.get("mode", "load_more"),
-      "page": page,
-      "page_size": page_size,
-      "total_items": total_items,
-      "total_pages": total_pages,
-      "has_more": (end < total_items) if page_size else False,
-    }
+    data["paging"] = _paging_dict(
+      page=page,
+      page_size=page_size,
+      total_items=total_items,
+      mode=paging_cfg.get("mode", _LOAD_MORE),
+      enabled=paging_enabled,
+    )
+
+    if cacheable:
+      if len(self._hydrated_cache) >= self._HYDRATED_CACHE_MAX:
+        self._hydrated_cache.clear()
+      self._hydrated_cache[cache_key] = data
 
     return data
   
@@ -170,7 +252,7 @@ class CollectionResolver:
     self,
     block: CollectionBlock,
     current_node_path: str
-  ) -> List[str]:
+  ) -> Sequence[str]:
     """
     Resolve the node paths for this collection, using the in-memory graph.
     
@@ -179,7 +261,7 @@ class CollectionResolver:
     
     Future: source="roster", source="tag", source="query"
     """
-    if block.source == "folder":
+    if block.source == _FOLDER:
       return self._resolve_folder_source(block.path)
     
     # Future sources:
@@ -190,47 +272,46 @@ class CollectionResolver:
     # elif block.source == "query":
     #   return self._resolve_query_source(block.filters)
     
-    return []
+    return ()
   
-  def _resolve_folder_source(self, path: Optional[str]) -> List[str]:
+  def _resolve_folder_source(self, path: Optional[str]) -> Sequence[str]:
     """Resolve collection items from a folder path (direct children only)."""
     if not path:
-      return []
-    
+      return ()
+
     base = path.strip("/")
 
-    # Fast path: if we have direct children index
-    if base in self.graph.children_by_parent:
-      return list(self.graph.children_by_parent[base])
-
-    # Fallback: prefix scan (direct children only)
-    prefix = base + "/"
-    out: List[str] = []
-    for p in self.graph.nodes.keys():
-      if not p.startswith(prefix):
-        continue
-      rest = p[len(prefix):]
-      if "/" in rest:
-        continue  # not a direct child
-      out.append(p)
-
-    return out
+    # children_by_parent entries are frozen tuples after graph load and
+    # every consumer is read-only, so hand them out without copying.
+    return self.graph.children_by_parent.get(base, ())
   
-  def _apply_sort(self, paths: List[str], sort: Optional[str]) -> List[str]:
+  def _apply_sort(
+    self,
+    paths: Sequence[str],
+    sort: Optional[str],
+    parent: Optional[str] = None,
+  ) -> Sequence[str]:
     """Apply sorting to collection items."""
     sort = sort or "name_asc"
 
     if sort == "random":
-      import random
-      out = paths[:]
-      random.shuffle(out)
-      return out
-
-    if sort == "name_asc":
-      return sorted(paths, key=lambda p: self._sort_title(p).lower())
-
-    if sort == "name_desc":
-      return sorted(paths, key=lambda p: self._sort_title(p).lower(), reverse=True)
+      # Sampling happens at page-slice time (_sample_page) so we never
+      # shuffle thousands of paths to keep 24.
+      return paths
+
+    # Folder collections can reuse the graph's per-parent sorted index
+    # instead of re-sorting the same children on every request.
+    if parent is not None:
+      cached = self.graph.sorted_children(parent, sort)
+      if cached is not None and len(cached) == len(paths):
+        return cached
+
+    if sort in ("name_asc", "name_desc"):
+      # Decorate-sort-undecorate: compute each title once (O(N)) instead
+      # of re-running get_node + attribute chains inside the comparator.
+      decorated = [(self._sort_title(p).lower(), p) for p in paths]
+      decorated.sort(reverse=(sort == "name_desc"))
+      return [p for _, p in decorated]
 
     # Future: date-based sorts, etc. (tracks/albums)
     # if sort == "created_at_desc": ...
@@ -238,18 +319,45 @@ class CollectionResolver:
 
     return paths
   
+  def _cursor_start(self, paths: Sequence[str], cursor: str, sort: Optional[str]) -> int:
+    """
+    Index just past the cursor item. The default title sort orders by
+    (title, path), so we can bisect in O(log n); anything else falls back
+    to a linear scan. Unknown cursors restart from the top.
+    """
+    if (sort or "name_asc") == "name_asc":
+      key = (self._sort_title(cursor).lower(), cursor)
+      i = bisect.bisect_right(paths, key, key=lambda p: (self._sort_title(p).lower(), p))
+      if i > 0 and paths[i - 1] == cursor:
+        return i
+    try:
+      return paths.index(cursor) + 1
+    except ValueError:
+      return 0
+
+  @staticmethod
+  def _sample_page(candidates: Sequence[str], k: int, seed: Optional[int] = None) -> List[str]:
+    """O(k) random page selection instead of shuffling the whole list."""
+    k = min(k, len(candidates))
+    if k <= 0:
+      return []
+    rng = random.Random(seed) if seed is not None else random
+    return rng.sample(candidates, k)
+
+  @staticmethod
+  def _sort_parent(block: CollectionBlock) -> Optional[str]:
+    """Parent key for the graph's sorted-children index, if applicable."""
+    if block.source == "folder" and block.path:
+      return block.path.strip("/")
+    return None
+
   def _sort_title(self, node_path: str) -> str:
     """Get the sortable title for a node."""
-    node = self.graph.get_node(node_path)
-    if node and node.preview and node.preview.title:
-      return node.preview.title
-    if node and node.title:
-      return node.title
-    return node_path
+    return self.graph._sort_title(node_path)
   
-  def _item_payload(self, node_path: str) -> Dict[str, Any]:
+  @staticmethod
+  def _item_payload(node_path: str, node) -> Dict[str, Any]:
     """Return lightweight data for collection cards."""
-    node = self.graph.get_node(node_path)
     if not node:
       return {"path": node_path}
 
@@ -258,7 +366,7 @@ class CollectionResolver:
       "layout": node.meta.layout,
       "slug": node.meta.slug,
       "display_name": node.meta.display_name,
-      "preview": asdict(node.preview) if node.preview else None,
+      "preview": node.preview.to_dict() if node.preview else None,
       # optional: include some metadata for client-side sort/filter later
       "meta": {
         # "genres": node.meta.extra.get("genres"),
@@ -1,7 +1,21 @@
 """Content graph - the core CMS data structure for the artist node."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+import bisect
+import json
+import os
+import sys
+
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+  import orjson
+except ImportError:  # pragma: no cover - optional speedup
+  orjson = None
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Dict, List, Optional, Any
 
 # Import all block types and node classes from refactored modules
@@ -30,14 +44,45 @@ class ContentGraph:
 
   # Derived indexes for fast traversal:
   children_by_parent: Dict[str, List[str]] = field(default_factory=dict)
+  # parent path -> sort mode ("name_asc"/"name_desc") -> sorted child paths,
+  # filled lazily so the per-request sort amortizes to once per graph load.
+  sorted_children_by_parent: Dict[str, Dict[str, List[str]]] = field(default_factory=dict)
+  # node path -> [path, parent, grandparent, ...] so ancestor walks are a
+  # single dict fetch plus a short scan instead of hop-by-hop lookups.
+  ancestor_chain: Dict[str, List[str]] = field(default_factory=dict)
   artists: List[str] = field(default_factory=list)   # list of node paths for artist roots
   albums_by_artist: Dict[str, List[str]] = field(default_factory=dict)  # artist_id -> [album node paths]
   tracks_by_album: Dict[str, List[str]] = field(default_factory=dict)   # album node path -> [track node paths]
 
+  # Caps on the payload/JSON caches below; cleared wholesale when full so
+  # a graph larger than the cap cannot grow RSS without bound.
+  _PAYLOAD_CACHE_MAX = 1024
+  _JSON_CACHE_MAX = 1024
+
   def __post_init__(self):
-    """Initialize the collection resolver after dataclass init."""
+    """Initialize per-instance caches after dataclass init."""
+    # Resolved theme per node path; an ancestor chain resolved once covers
+    # every descendant that walks through it.
+    self._theme_cache: Dict[str, Optional[str]] = {}
+    # Fully hydrated page payloads per path. The graph is immutable per
+    # process, so a payload computed once serves every later request.
+    self._payload_cache: Dict[str, Dict[str, Any]] = {}
+    # Pre-serialized JSON bytes per path so cached pages skip encoding too.
+    self._json_cache: Dict[str, bytes] = {}
+    # Node paths ordered shallow-to-deep; bulk traversals that follow it
+    # hit the theme/ancestor caches top-down instead of randomly.
+    self._paths_by_depth: List[str] = []
+
+  @cached_property
+  def _collection_resolver(self):
+    """
+    Collection resolver, created on first use. Graphs built for tooling
+    or tests are often never queried, so construction stays free until a
+    collection actually resolves (import is deferred for the same
+    circular-import reason it lived in __post_init__).
+    """
     from backend.models.collection_resolver import CollectionResolver
-    self._collection_resolver = CollectionResolver(self)
+    return CollectionResolver(self)
 
   def get_collection_payload(
     self,
@@ -50,11 +95,12 @@ class ContentGraph:
     limit: Optional[int] = None,
     layout: Optional[Dict[str, Any]] = None,
     card: Optional[str] = None,
+    cursor: Optional[str] = None,
     current_node_path: str = "server",
   ) -> Dict[str, Any]:
     """
     Resolve + paginate a collection and return a frontend-friendly payload.
-    
+
     Delegates to CollectionResolver for all resolution logic.
     """
     return self._collection_resolver.resolve_collection(
@@ -66,39 +112,138 @@ class ContentGraph:
       limit=limit,
       layout=layout,
       card=card,
+      cursor=cursor,
       current_node_path=current_node_path,
     )
 
   def _hydrate_block(self, block: Block, current_node_path: str) -> Dict[str, Any]:
-    """Recursively hydrate blocks for page payload output."""
-    if isinstance(block, SectionBlock):
-      data = asdict(block)
-      inner = []
-      for child in block.blocks or []:
-        inner.append(self._hydrate_block(child, current_node_path=current_node_path))
-      data["blocks"] = inner
-      return data
-
+    """Hydrate a block (and any nested section tree) for page payload output."""
     if isinstance(block, CollectionBlock):
       return self._collection_resolver.hydrate_collection_block(block, current_node_path)
 
-    # default: plain asdict
-    return asdict(block)
+    if isinstance(block, MarkdownBlock):
+      return _markdown_payload(block)
+
+    if not isinstance(block, SectionBlock):
+      # leaf: the block's own hand-written serializer
+      return block.to_dict()
+
+    # Sections nest arbitrarily; walk them with an explicit stack of
+    # (block, parent "blocks" list) pairs instead of recursing - no frame
+    # setup per block and no recursion limit on pathological trees.
+    data = block.to_dict()
+    data["blocks"] = top = []
+    stack: List[tuple] = [(child, top) for child in reversed(block.blocks or [])]
+    resolver = self._collection_resolver
+
+    while stack:
+      b, parent_list = stack.pop()
+      if isinstance(b, SectionBlock):
+        d = b.to_dict()
+        d["blocks"] = inner = []
+        parent_list.append(d)
+        for child in reversed(b.blocks or []):
+          stack.append((child, inner))
+      elif isinstance(b, CollectionBlock):
+        parent_list.append(resolver.hydrate_collection_block(b, current_node_path))
+      elif isinstance(b, MarkdownBlock):
+        parent_list.append(_markdown_payload(b))
+      else:
+        parent_list.append(b.to_dict())
+
+    return data
 
   def get_node(self, path: str) -> Optional[ContentNode]:
     return self.nodes.get(path)
 
   def register_node(self, node: ContentNode) -> None:
-    """Add a node and update basic indexes."""
+    """
+    Add a node and update basic indexes.
+
+    Invalidation covers the graph's own memos (themes, payloads, JSON,
+    the resolver's hydrated collections). GraphOps-level caches - the
+    collection cache and the nav memos - are not reachable from here and
+    assume no post-startup registration; a server that registers nodes
+    while serving must rebuild its GraphOps.
+    """
     path = node.meta.path
     self.nodes[path] = node
 
+    # A new node can change theme inheritance or collection contents for
+    # any other node, so drop memoized results on mutation.
+    if self._theme_cache:
+      self._theme_cache.clear()
+    if self._payload_cache:
+      self._payload_cache.clear()
+    if self._json_cache:
+      self._json_cache.clear()
+    # cached_property: only instantiated once a collection resolved, so
+    # peek at __dict__ rather than forcing construction just to clear it.
+    if "_collection_resolver" in self.__dict__:
+      self._collection_resolver._hydrated_cache.clear()
+
+    # Precompute the nav href once; interning makes downstream dict
+    # lookups and comparisons pointer-equal.
+    if node.meta.href is None:
+      node.meta.href = "/" if path == self.root_content_path else sys.intern("/" + path)
+
     parent = node.meta.parent_path
     if parent:
-      self.children_by_parent.setdefault(parent, []).append(path)
+      # _build_indexes freezes the entries to tuples, so rebuild rather
+      # than append in place; registration is rare enough that the copy
+      # doesn't matter. Cached sort orders for the parent are now stale.
+      existing = self.children_by_parent.get(parent)
+      if existing is None:
+        self.children_by_parent[parent] = (path,)
+      elif path not in existing:
+        self.children_by_parent[parent] = (*existing, path)
+      self.sorted_children_by_parent.pop(parent, None)
+
+    # Extend the parent's ancestor chain when we have it; otherwise derive
+    # the chain from the path string the same way the theme walk used to.
+    parent_chain = self.ancestor_chain.get(parent) if parent else None
+    if parent_chain is not None:
+      self.ancestor_chain[path] = [path] + parent_chain
+    else:
+      self.ancestor_chain[path] = self._compute_chain(path)
+
+    bisect.insort(self._paths_by_depth, path, key=_path_depth)
+
+  def sorted_children(self, parent: str, sort: str) -> Optional[List[str]]:
+    """
+    Sorted child paths for a parent, cached per (parent, sort mode).
+    Returns None for parents with no children index or unknown sort modes.
+    """
+    if sort not in ("name_asc", "name_desc"):
+      return None
+    children = self.children_by_parent.get(parent)
+    if children is None:
+      return None
+
+    by_sort = self.sorted_children_by_parent.setdefault(parent, {})
+    cached = by_sort.get(sort)
+    if cached is None:
+      decorated = [(self._sort_title(p).lower(), p) for p in children]
+      decorated.sort(reverse=(sort == "name_desc"))
+      cached = [p for _, p in decorated]
+      by_sort[sort] = cached
+    return cached
+
+  def _sort_title(self, node_path: str) -> str:
+    """Sortable title for a node (preview title, then title, then path)."""
+    node = self.nodes.get(node_path)
+    if node and node.preview and node.preview.title:
+      return node.preview.title
+    if node and node.title:
+      return node.title
+    return node_path
 
   def to_page_payload(self, path: str) -> Optional[Dict[str, Any]]:
     """Shape a node into the JSON your frontend /api/page endpoint can return."""
+    cached = self._payload_cache.get(path)
+    if cached is not None:
+      return cached
+
     node = self.get_node(path)
     if not node:
       return None
@@ -115,8 +260,80 @@ class ContentGraph:
       hydrated_blocks.append(self._hydrate_block(block, current_node_path=path))
     payload["content"] = hydrated_blocks
 
+    # Random-sorted collections re-sample per request, so only pure
+    # payloads are safe to memoize. Consumers treat payloads as read-only.
+    # The type-tag tuple rules out most pages without touching blocks.
+    ctypes = node.content_types
+    has_random = ("collection" in ctypes or "section" in ctypes) and any(
+      self._block_is_random(b) for b in node.content
+    )
+    if not has_random:
+      if len(self._payload_cache) >= self._PAYLOAD_CACHE_MAX:
+        self._payload_cache.clear()
+      self._payload_cache[path] = payload
+
     return payload
 
+  def to_page_payload_json(self, path: str) -> Optional[bytes]:
+    """
+    Serialized page payload as JSON bytes, cached per path. Saves the
+    JSON-encoding pass on every hit once the payload itself is cacheable.
+    """
+    cached = self._json_cache.get(path)
+    if cached is not None:
+      return cached
+
+    payload = self.to_page_payload(path)
+    if payload is None:
+      return None
+
+    if orjson is not None:
+      body = orjson.dumps(payload)
+    else:
+      body = json.dumps(payload).encode("utf-8")
+
+    # Only memoize bytes for payloads the dict cache also kept - pages
+    # with random-sorted collections must re-encode per request.
+    if path in self._payload_cache:
+      if len(self._json_cache) >= self._JSON_CACHE_MAX:
+        self._json_cache.clear()
+      self._json_cache[path] = body
+    return body
+
+  @staticmethod
+  def _block_is_random(block: Block) -> bool:
+    """True if the block (or a nested one) resolves a random-sorted collection."""
+    if isinstance(block, CollectionBlock):
+      return block.sort == "random"
+    if isinstance(block, SectionBlock):
+      return any(ContentGraph._block_is_random(b) for b in block.blocks or [])
+    return False
+
+  def precompile(self) -> None:
+    """
+    Hydrate every node's page payload up front so the first request per
+    page is as cheap as the hundredth. Intended to run once after graph
+    load, before serving.
+
+    Large graphs hydrate across a thread pool - each node only reads the
+    shared graph, and the caches are plain dicts whose single get/set
+    ops are atomic under the GIL (a race costs a redundant compute, not
+    corruption). Small graphs skip the pool overhead.
+    """
+    # Shallow-to-deep order primes the theme/ancestor caches so every
+    # deeper node's walk terminates on its first cached ancestor.
+    paths = self._paths_by_depth or list(self.nodes)
+    if len(paths) <= 256:
+      for path in paths:
+        self.to_page_payload(path)
+      return
+
+    workers = min(32, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+      # consume the iterator so worker exceptions surface here
+      for _ in executor.map(self.to_page_payload, paths):
+        pass
+
   def _resolve_theme(self, path: str) -> Optional[str]:
     """
     Walk up the node tree to find the nearest theme.
@@ -125,27 +342,67 @@ class ContentGraph:
     Handles missing intermediate nodes by computing parent from path string.
     e.g. server/pages/releases -> server/pages -> server (even if server/pages doesn't exist)
     """
-    current_path: Optional[str] = path
-
-    while current_path:
-      node = self.get_node(current_path)
-      
-      # If node exists and has a theme, use it
+    cache = self._theme_cache
+    cached = cache.get(path)
+    if cached is not None or path in cache:
+      return cached
+
+    chain = self.ancestor_chain.get(path)
+    if chain is None:
+      chain = self._compute_chain(path)
+
+    nodes = self.nodes
+    for i, p in enumerate(chain):
+      cached = cache.get(p)
+      if cached is not None or p in cache:
+        return self._fill_theme_cache(chain[:i], cached)
+
+      node = nodes.get(p)
       if node and node.meta.theme:
-        return node.meta.theme
+        return self._fill_theme_cache(chain[:i + 1], node.meta.theme)
 
-      # Move to parent - prefer node's parent_path, but fall back to computing from path
+    # No theme found in ancestors, use root theme
+    return self._fill_theme_cache(chain, self.root_theme)
+
+  def _compute_chain(self, path: str) -> List[str]:
+    """
+    Ancestor chain for a path, preferring each node's parent_path and
+    falling back to the path string when intermediate nodes are missing.
+    e.g. server/pages/releases -> server/pages -> server (even if
+    server/pages doesn't exist)
+    """
+    chain: List[str] = []
+    current = path
+    while current:
+      chain.append(current)
+      node = self.nodes.get(current)
       if node and node.meta.parent_path:
-        current_path = node.meta.parent_path
-      elif "/" in current_path:
-        # Node doesn't exist or has no parent_path - compute parent from path string
-        current_path = "/".join(current_path.split("/")[:-1])
+        current = node.meta.parent_path
+      elif "/" in current:
+        current = current[:current.rfind("/")]
       else:
-        # We're at a root-level path with no parent
         break
+    return chain
 
-    # No theme found in ancestors, use root theme
-    return self.root_theme
+  def _fill_theme_cache(self, visited: List[str], theme: Optional[str]) -> Optional[str]:
+    """Backfill the theme cache for every path touched during a walk."""
+    cache = self._theme_cache
+    for p in visited:
+      cache[p] = theme
+    return theme
+
+  @classmethod
+  def from_json_file(cls, path) -> "ContentGraph":
+    """
+    Load a graph from a JSON file, constructing Block instances during
+    the parse via object_hook instead of materializing the full dict
+    tree and walking it a second time in from_dict. Only dicts whose
+    "type" tag names a registered block builder are converted; all other
+    dicts pass through untouched.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+      data = json.load(f, object_hook=_block_object_hook)
+    return cls.from_dict(data)
 
   @classmethod
   def from_dict(cls, data: Dict[str, Any]) -> "ContentGraph":
@@ -180,7 +437,11 @@ class ContentGraph:
         )
 
       blocks_json = node_data.get("content", [])
-      blocks: List[Block] = [cls._block_from_dict(b) for b in blocks_json]
+      # entries may already be Block instances when loaded via the
+      # object_hook path
+      blocks: List[Block] = [
+        b if not isinstance(b, dict) else cls._block_from_dict(b) for b in blocks_json
+      ]
 
       node = ContentNode(
         meta=meta,
@@ -190,124 +451,297 @@ class ContentGraph:
         preview=preview,
         content=blocks,
       )
-      graph.register_node(node)
+      graph.nodes[node.meta.path] = node
 
     # if builder persisted children_by_parent, restore it
     if "children_by_parent" in data:
       graph.children_by_parent = data["children_by_parent"]
 
-    # (artists / albums_by_artist / tracks_by_album we can restore later if needed)
+    # derive everything else - children, rollups, hrefs, chains - at once
+    graph._build_indexes()
     return graph
 
+  def _build_indexes(self) -> None:
+    """
+    Populate every derived index in a single pass over the nodes:
+    children_by_parent (deriving the parent from the path string when
+    meta.parent_path is missing), the artist/album/track rollups, the
+    precomputed hrefs and the ancestor chains. With a complete children
+    index, folder lookups never fall back to a full-graph prefix scan.
+    """
+    root = self.root_content_path
+    children: Dict[str, List[str]] = defaultdict(list)
+    # Per-parent membership sets keep the dedup below O(1) per child
+    # instead of scanning the sibling list (quadratic for flat folders).
+    seen: Dict[str, set] = {}
+    for parent, kids in self.children_by_parent.items():
+      children[parent].extend(kids)
+      seen[parent] = set(kids)
+
+    artists: List[str] = []
+    albums: Dict[str, List[str]] = defaultdict(list)
+    tracks: Dict[str, List[str]] = defaultdict(list)
+
+    for path, node in self.nodes.items():
+      meta = node.meta
+      if meta.href is None:
+        meta.href = "/" if path == root else sys.intern("/" + path)
+
+      parent = meta.parent_path
+      if not parent and "/" in path:
+        parent = path[:path.rfind("/")]
+      if parent:
+        siblings = seen.setdefault(parent, set())
+        if path not in siblings:
+          siblings.add(path)
+          children[parent].append(path)
+
+      layout = meta.layout
+      if layout == "artist":
+        artists.append(path)
+      elif layout == "album" and parent:
+        albums[parent].append(path)
+      elif layout == "track" and parent:
+        tracks[parent].append(path)
+
+    # Freeze the children entries: downstream consumers are read-only, so
+    # tuples let folder lookups hand them out without a defensive copy.
+    self.children_by_parent = {p: tuple(c) for p, c in children.items()}
+    self.artists = artists
+    self.albums_by_artist = dict(albums)
+    self.tracks_by_album = dict(tracks)
+
+    chains = self.ancestor_chain
+    for path in self.nodes:
+      if path not in chains:
+        chains[path] = self._compute_chain(path)
+
+    self._paths_by_depth = sorted(self.nodes, key=_path_depth)
+
   @staticmethod
   def _block_from_dict(data: Dict[str, Any]) -> Block:
-    btype = data.get("type")
-
-    if btype == "hero":
-      sigil_data = data.get("sigil")
-      sigil = None
-      if sigil_data:
-        sigil = SigilConfig(
-          type=sigil_data.get("type", "p5"),
-          id=sigil_data.get("id"),
-          src=sigil_data.get("src"),
-          alt=sigil_data.get("alt"),
-          options=sigil_data.get("options"),
-        )
-      return HeroBlock(
-        heading=data.get("heading", ""),
-        subheading=data.get("subheading"),
-        body=data.get("body"),
-        cta=data.get("cta"),
-        sigil=sigil,
-        background=data.get("background"),
-      )
-
-    if btype == "section":
-      inner_blocks = [
-        ContentGraph._block_from_dict(b) for b in data.get("blocks", []) or []
-      ]
-      return SectionBlock(
-        id=data.get("id"),
-        label=data.get("label"),
-        blocks=inner_blocks,
-        align=data.get("align"),
-      )
-
-    if btype == "markdown":
-      return MarkdownBlock(body=data.get("body", ""))
-
-    if btype == "subpage":
-      return SubpageBlock(
-        ref=data.get("ref", ""),
-        label=data.get("label"),
-        nav=data.get("nav", False),
-      )
-
-    if btype == "collection":
-      layout_data = data.get("layout") or None
-      paging_data = data.get("paging") or None
-
-      layout = None
-      if layout_data:
-        layout = CollectionLayout(
-          mode=layout_data.get("mode", "grid"),
-          columns=layout_data.get("columns"),
-          gap=layout_data.get("gap"),
-          align=layout_data.get("align"),
-          max_rows=layout_data.get("max_rows"),
-          pagination=layout_data.get("pagination"),
-          dense=layout_data.get("dense"),
-          show_dividers=layout_data.get("show_dividers"),
-          show_avatar=layout_data.get("show_avatar"),
-          show_meta=layout_data.get("show_meta"),
-          max_items=layout_data.get("max_items"),
-          slides_per_view=layout_data.get("slides_per_view"),
-          spacing=layout_data.get("spacing"),
-          loop=layout_data.get("loop"),
-          autoplay=layout_data.get("autoplay"),
-          controls=layout_data.get("controls"),
-          snap_align=layout_data.get("snap_align"),
-          max_width=layout_data.get("max_width"),
-        )
-
-      paging = None
-      if paging_data:
-        paging = CollectionPaging(
-          enabled=paging_data.get("enabled", False),
-          page_size=paging_data.get("page_size"),
-          mode=paging_data.get("mode", "load_more"),
-        )
-
-      return CollectionBlock(
-        source=data.get("source", "folder"),
-        path=data.get("path"),
-        layout=layout,
-        card=data.get("card"),
-        sort=data.get("sort"),
-        sort_options=data.get("sort_options"),
-        limit=data.get("limit"),
-        filters=data.get("filters"),
-        paging=paging,
-        empty_state=data.get("empty_state"),
-      )
-
-    if btype == "audio_player":
-      visualizer_data = data.get("visualizer")
-      visualizer = None
-      if visualizer_data:
-        visualizer = VisualizerConfig(
-          type=visualizer_data.get("type", "p5"),
-          id=visualizer_data.get("id", "spectrum-bars"),
-          options=visualizer_data.get("options"),
-        )
-      return AudioPlayerBlock(
-        src=data.get("src", ""),
-        title=data.get("title"),
-        artist=data.get("artist"),
-        artwork=data.get("artwork"),
-        visualizer=visualizer,
-      )
-
-    # fallback so we don't blow up on unknown blocks
-    return MarkdownBlock(body=str(data))
+    builder = _BLOCK_BUILDERS.get(data.get("type"), _build_fallback_block)
+    return builder(data)
+
+
+def _path_depth(path: str) -> int:
+  """Sort key for shallow-to-deep node ordering."""
+  return path.count("/")
+
+
+# Hydrated markdown dicts shared per unique body. Sites repeat blurbs and
+# footers verbatim across many nodes; one flyweight dict serves them all.
+# Consumers treat hydrated payloads as read-only. Cleared when full.
+_MD_DICT_CACHE: Dict[str, Dict[str, Any]] = {}
+_MD_DICT_CACHE_MAX = 1024
+
+
+def _markdown_payload(block: MarkdownBlock) -> Dict[str, Any]:
+  body = block.body
+  d = _MD_DICT_CACHE.get(body)
+  if d is None:
+    if len(_MD_DICT_CACHE) >= _MD_DICT_CACHE_MAX:
+      _MD_DICT_CACHE.clear()
+    d = block.to_dict()
+    _MD_DICT_CACHE[body] = d
+  return d
+
+
+# ---------------------------------------------------------------------------
+# Block builders. One free function per block type, dispatched through
+# _BLOCK_BUILDERS - an O(1) hash lookup instead of a linear if/elif chain,
+# and new block types register here without touching the graph class.
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Flyweight caches for the frozen config dataclasses. Sites reuse the same
+# layout/paging/sigil configs across many blocks; interning them through
+# these factories allocates each distinct config once. Cleared when full.
+# ---------------------------------------------------------------------------
+_CONFIG_CACHE: Dict[tuple, Any] = {}
+_CONFIG_CACHE_MAX = 1024
+
+
+def _freeze_key(value: Any) -> Any:
+  """Recursively convert dicts/lists into hashable tuples for cache keys."""
+  if isinstance(value, dict):
+    return tuple(sorted((k, _freeze_key(v)) for k, v in value.items()))
+  if isinstance(value, list):
+    return tuple(_freeze_key(v) for v in value)
+  return value
+
+
+def _shared_config(cls: type, data: Dict[str, Any], build) -> Any:
+  key = (cls, _freeze_key(data))
+  try:
+    inst = _CONFIG_CACHE.get(key)
+  except TypeError:
+    # unhashable leaf value - just build an unshared instance
+    return build(data)
+  if inst is None:
+    if len(_CONFIG_CACHE) >= _CONFIG_CACHE_MAX:
+      _CONFIG_CACHE.clear()
+    inst = build(data)
+    _CONFIG_CACHE[key] = inst
+  return inst
+
+
+def _build_sigil_config(sigil_data: Dict[str, Any]) -> SigilConfig:
+  sget = sigil_data.get
+  return SigilConfig(
+    type=sys.intern(sget("type", "p5")),
+    id=sget("id"),
+    src=sget("src"),
+    alt=sget("alt"),
+    options=sget("options"),
+  )
+
+
+def _build_hero_block(data: Dict[str, Any]) -> HeroBlock:
+  get = data.get
+  sigil_data = get("sigil")
+  sigil = None
+  if sigil_data:
+    sigil = _shared_config(SigilConfig, sigil_data, _build_sigil_config)
+  return HeroBlock(
+    heading=get("heading", ""),
+    subheading=get("subheading"),
+    body=get("body"),
+    cta=get("cta"),
+    sigil=sigil,
+    background=get("background"),
+  )
+
+
+def _build_section_block(data: Dict[str, Any]) -> SectionBlock:
+  # children arrive pre-built on the object_hook path (hooks fire bottom-up)
+  inner_blocks = [
+    b if not isinstance(b, dict) else ContentGraph._block_from_dict(b)
+    for b in data.get("blocks", []) or []
+  ]
+  return SectionBlock(
+    id=data.get("id"),
+    label=data.get("label"),
+    blocks=inner_blocks,
+    align=data.get("align"),
+  )
+
+
+def _build_markdown_block(data: Dict[str, Any]) -> MarkdownBlock:
+  return MarkdownBlock(body=data.get("body", ""))
+
+
+def _build_subpage_block(data: Dict[str, Any]) -> SubpageBlock:
+  return SubpageBlock(
+    ref=data.get("ref", ""),
+    label=data.get("label"),
+    nav=data.get("nav", False),
+  )
+
+
+def _build_collection_layout(layout_data: Dict[str, Any]) -> CollectionLayout:
+  lget = layout_data.get
+  return CollectionLayout(
+    mode=sys.intern(lget("mode", "grid")),
+    columns=lget("columns"),
+    gap=lget("gap"),
+    align=lget("align"),
+    max_rows=lget("max_rows"),
+    pagination=lget("pagination"),
+    dense=lget("dense"),
+    show_dividers=lget("show_dividers"),
+    show_avatar=lget("show_avatar"),
+    show_meta=lget("show_meta"),
+    max_items=lget("max_items"),
+    slides_per_view=lget("slides_per_view"),
+    spacing=lget("spacing"),
+    loop=lget("loop"),
+    autoplay=lget("autoplay"),
+    controls=lget("controls"),
+    snap_align=lget("snap_align"),
+    max_width=lget("max_width"),
+  )
+
+
+def _build_collection_paging(paging_data: Dict[str, Any]) -> CollectionPaging:
+  pget = paging_data.get
+  return CollectionPaging(
+    enabled=pget("enabled", False),
+    page_size=pget("page_size"),
+    mode=sys.intern(pget("mode", "load_more")),
+  )
+
+
+def _build_collection_block(data: Dict[str, Any]) -> CollectionBlock:
+  get = data.get
+  layout_data = get("layout") or None
+  paging_data = get("paging") or None
+
+  layout = None
+  if layout_data:
+    layout = _shared_config(CollectionLayout, layout_data, _build_collection_layout)
+
+  paging = None
+  if paging_data:
+    paging = _shared_config(CollectionPaging, paging_data, _build_collection_paging)
+
+  path = get("path")
+  return CollectionBlock(
+    source=sys.intern(get("source", "folder")),
+    path=sys.intern(path) if path else path,
+    layout=layout,
+    card=get("card"),
+    sort=get("sort"),
+    sort_options=get("sort_options"),
+    limit=get("limit"),
+    filters=get("filters"),
+    paging=paging,
+    empty_state=get("empty_state"),
+  )
+
+
+def _build_visualizer_config(visualizer_data: Dict[str, Any]) -> VisualizerConfig:
+  vget = visualizer_data.get
+  return VisualizerConfig(
+    type=sys.intern(vget("type", "p5")),
+    id=sys.intern(vget("id", "spectrum-bars")),
+    options=vget("options"),
+  )
+
+
+def _build_audio_player_block(data: Dict[str, Any]) -> AudioPlayerBlock:
+  get = data.get
+  visualizer_data = get("visualizer")
+  visualizer = None
+  if visualizer_data:
+    visualizer = _shared_config(VisualizerConfig, visualizer_data, _build_visualizer_config)
+  return AudioPlayerBlock(
+    src=get("src", ""),
+    title=get("title"),
+    artist=get("artist"),
+    artwork=get("artwork"),
+    visualizer=visualizer,
+  )
+
+
+def _build_fallback_block(data: Dict[str, Any]) -> MarkdownBlock:
+  # fallback so we don't blow up on unknown blocks
+  return MarkdownBlock(body=str(data))
+
+
+_BLOCK_BUILDERS = {
+  "hero": _build_hero_block,
+  "section": _build_section_block,
+  "markdown": _build_markdown_block,
+  "subpage": _build_subpage_block,
+  "collection": _build_collection_block,
+  "audio_player": _build_audio_player_block,
+}
+
+
+def _block_object_hook(d: Dict[str, Any]) -> Any:
+  """json.load hook: build blocks as the parser emits their dicts."""
+  builder = _BLOCK_BUILDERS.get(d.get("type")) if "type" in d else None
+  if builder is not None:
+    return builder(d)
+  return d
@@ -13,6 +13,33 @@ def _deep_merge(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
   return out
 
 
+def merge_layout_defaults(defaults: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+  """
+  Layout defaults merged with client/block overrides.
+
+  The common case is no overrides at all, which returns the shared
+  defaults dict untouched (consumers treat layouts as read-only), so
+  the merge copy only happens when there is something to merge.
+  """
+  if not override:
+    return defaults
+  # Shallow-copy the defaults (they nest at most one dict level) and merge
+  # the override in place - one copy per call instead of one per recursion.
+  merged = {k: dict(v) if isinstance(v, dict) else v for k, v in defaults.items()}
+  return _deep_merge_inplace(merged, override)
+
+
+def _deep_merge_inplace(target: Dict[str, Any], source: Dict[str, Any]) -> Dict[str, Any]:
+  """Merge source into target, mutating target. target must be caller-owned."""
+  for k, v in (source or {}).items():
+    cur = target.get(k)
+    if isinstance(v, dict) and isinstance(cur, dict):
+      _deep_merge_inplace(cur, v)
+    else:
+      target[k] = v
+  return target
+
+
 DEFAULT_COLLECTION_LAYOUTS: Dict[str, Dict[str, Any]] = {
   "grid": {
     "mode": "grid",
@@ -39,5 +66,5 @@ DEFAULT_COLLECTION_LAYOUTS: Dict[str, Dict[str, Any]] = {
 }
 
 
-__all__ = ["DEFAULT_COLLECTION_LAYOUTS", "_deep_merge"]
+__all__ = ["DEFAULT_COLLECTION_LAYOUTS", "_deep_merge", "_deep_merge_inplace", "merge_layout_defaults"]
 
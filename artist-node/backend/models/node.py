@@ -1,25 +1,15 @@
 """Content node and metadata classes."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Any
-
-from backend.models.blocks import (
-  Block,
-  HeroBlock,
-  SectionBlock,
-  MarkdownBlock,
-  SubpageBlock,
-  CollectionBlock,
-  AudioPlayerBlock,
-  SigilConfig,
-  CollectionLayout,
-  CollectionPaging,
-  VisualizerConfig,
-)
-
-
-@dataclass
+import sys
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Tuple
+
+from backend.models.blocks import Block
+
+
+@dataclass(slots=True)
 class NodeMeta:
   path: str                # "server", "artists/zol", "server/pages/store", etc.
   parent_path: Optional[str]  # None for root nodes like "server"
@@ -30,9 +20,37 @@ class NodeMeta:
   effects: List[str] = field(default_factory=list)  # ["crt", "chroma", "glow"] - visual FX layers
   extra: Dict[str, Any] = field(default_factory=dict)
   # extra can hold things like imprints, roster, status, etc.
+  href: Optional[str] = None  # precomputed by the graph at registration time
+
+  def __post_init__(self):
+    # Paths, parent paths and layout names repeat across thousands of
+    # nodes (layout draws from a handful of values, every child repeats
+    # its parent's path). Interning folds the duplicates and turns the
+    # graph's dict lookups on these keys into pointer comparisons.
+    self.path = sys.intern(self.path)
+    if self.parent_path:
+      self.parent_path = sys.intern(self.parent_path)
+    if self.layout:
+      self.layout = sys.intern(self.layout)
+    if self.theme:
+      self.theme = sys.intern(self.theme)
+    if self.effects:
+      # Effect names draw from a tiny vocabulary ("crt", "chroma", ...)
+      self.effects = [sys.intern(e) for e in self.effects]
+
+  def to_dict(self) -> Dict[str, Any]:
+    """Payload-shaped dict (path/parent/href stay out - the payload carries path separately)."""
+    return {
+      "layout": self.layout,
+      "slug": self.slug,
+      "display_name": self.display_name,
+      "theme": self.theme,
+      "effects": self.effects,
+      "extra": self.extra,
+    }
 
 
-@dataclass
+@dataclass(slots=True)
 class NodePreview:
   title: str
   subtitle: Optional[str] = None
@@ -40,8 +58,18 @@ class NodePreview:
   badge: Optional[str] = None   # e.g. "Artist", "Album", "Set"
   blurb: Optional[str] = None   # short card/body text
 
+  def to_dict(self) -> Dict[str, Any]:
+    """Flat dict walker - avoids asdict's deepcopy/recursion overhead."""
+    return {
+      "title": self.title,
+      "subtitle": self.subtitle,
+      "image": self.image,
+      "badge": self.badge,
+      "blurb": self.blurb,
+    }
+
 
-@dataclass
+@dataclass(slots=True)
 class ContentNode:
   meta: NodeMeta
   title: Optional[str] = None
@@ -49,24 +77,23 @@ class ContentNode:
   background: Optional[str] = None      # page-level background image path
   preview: Optional[NodePreview] = None
   content: List[Block] = field(default_factory=list)
+  # Parallel type tags so "does this page have an X block" checks scan a
+  # flat tuple of interned strings instead of dereferencing each block.
+  content_types: Tuple[str, ...] = field(init=False, repr=False, default=())
+
+  def __post_init__(self):
+    self.content_types = tuple(b.type for b in self.content)
 
   def to_dict(self) -> Dict[str, Any]:
     """Serialize to a JSON-friendly dict for the frontend."""
     return {
       "path": self.meta.path,
-      "meta": {
-        "layout": self.meta.layout,
-        "slug": self.meta.slug,
-        "display_name": self.meta.display_name,
-        "theme": self.meta.theme,
-        "effects": self.meta.effects,
-        "extra": self.meta.extra,
-      },
+      "meta": self.meta.to_dict(),
       "title": self.title,
       "tagline": self.tagline,
       "background": self.background,
-      "preview": asdict(self.preview) if self.preview else None,
-      "content": [asdict(block) for block in self.content],
+      "preview": self.preview.to_dict() if self.preview else None,
+      "content": [block.to_dict() for block in self.content],
     }
 
   @classmethod
@@ -99,112 +126,13 @@ class ContentNode:
         blurb=preview_raw.get("blurb"),
       )
 
+    # Blocks rebuild through the graph's builder dispatch table - one
+    # decoder for both load paths (deferred import, node.py is imported
+    # by content_graph.py).
+    from backend.models.content_graph import ContentGraph
+
     blocks_raw = data.get("content") or []
-    blocks: List[Block] = []
-    for b in blocks_raw:
-      btype = b.get("type")
-      if btype == "hero":
-        sigil_data = b.get("sigil")
-        sigil = None
-        if sigil_data:
-          sigil = SigilConfig(
-            type=sigil_data.get("type", "p5"),
-            id=sigil_data.get("id"),
-            src=sigil_data.get("src"),
-            alt=sigil_data.get("alt"),
-            options=sigil_data.get("options"),
-          )
-        blocks.append(HeroBlock(
-          heading=b.get("heading", ""),
-          subheading=b.get("subheading"),
-          body=b.get("body"),
-          cta=b.get("cta"),
-          sigil=sigil,
-          background=b.get("background"),
-        ))
-      elif btype == "section":
-        # we can recurse into nested blocks later as needed
-        blocks.append(SectionBlock(
-          id=b.get("id"),
-          label=b.get("label"),
-          blocks=[],  # TODO: support nested blocks
-          align=b.get("align"),
-        ))
-      elif btype == "markdown":
-        blocks.append(MarkdownBlock(
-          body=b.get("body", ""),
-        ))
-      elif btype == "subpage":
-        blocks.append(SubpageBlock(
-          ref=b.get("ref", ""),
-          label=b.get("label"),
-          nav=b.get("nav", False),
-        ))
-      elif btype == "collection":
-        # Parse layout config if present
-        layout_data = b.get("layout")
-        layout = None
-        if layout_data:
-          layout = CollectionLayout(
-            mode=layout_data.get("mode", "grid"),
-            columns=layout_data.get("columns"),
-            gap=layout_data.get("gap"),
-            align=layout_data.get("align"),
-            max_rows=layout_data.get("max_rows"),
-            pagination=layout_data.get("pagination"),
-            dense=layout_data.get("dense"),
-            show_dividers=layout_data.get("show_dividers"),
-            show_avatar=layout_data.get("show_avatar"),
-            show_meta=layout_data.get("show_meta"),
-            max_items=layout_data.get("max_items"),
-            slides_per_view=layout_data.get("slides_per_view"),
-            spacing=layout_data.get("spacing"),
-            loop=layout_data.get("loop"),
-            autoplay=layout_data.get("autoplay"),
-            controls=layout_data.get("controls"),
-            snap_align=layout_data.get("snap_align"),
-            max_width=layout_data.get("max_width"),
-          )
-        
-        # Parse paging config if present
-        paging_data = b.get("paging")
-        paging = None
-        if paging_data:
-          paging = CollectionPaging(
-            enabled=paging_data.get("enabled", False),
-            page_size=paging_data.get("page_size"),
-            mode=paging_data.get("mode", "load_more"),
-          )
-        
-        blocks.append(CollectionBlock(
-          source=b.get("source", "folder"),
-          path=b.get("path"),
-          layout=layout,
-          card=b.get("card"),
-          sort=b.get("sort"),
-          sort_options=b.get("sort_options"),
-          limit=b.get("limit"),
-          filters=b.get("filters"),
-          paging=paging,
-          empty_state=b.get("empty_state"),
-        ))
-      elif btype == "audio_player":
-        visualizer_data = b.get("visualizer")
-        visualizer = None
-        if visualizer_data:
-          visualizer = VisualizerConfig(
-            type=visualizer_data.get("type", "p5"),
-            id=visualizer_data.get("id", "spectrum-bars"),
-            options=visualizer_data.get("options"),
-          )
-        blocks.append(AudioPlayerBlock(
-          src=b.get("src", ""),
-          title=b.get("title"),
-          artist=b.get("artist"),
-          artwork=b.get("artwork"),
-          visualizer=visualizer,
-        ))
-      # else: unknown type, ignore for now
+    blocks: List[Block] = [ContentGraph._block_from_dict(b) for b in blocks_raw]
 
     return cls(
       meta=meta,
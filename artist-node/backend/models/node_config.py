@@ -6,6 +6,14 @@ from typing import Optional, List, Dict, Any
 
 import yaml
 
+# Prefer libyaml's C parser when PyYAML was built with it - same
+# documents, much faster parse on startup.
+try:
+  from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+  from yaml import SafeLoader as _SafeLoader
+
+
 @dataclass
 class NodeConfig:
   """
@@ -30,7 +38,7 @@ class NodeConfig:
       raise FileNotFoundError(f"Node configuration file not found: {node_config_path}")
 
     with node_config_path.open("r", encoding="utf-8") as f:
-      raw = yaml.safe_load(f) or {}
+      raw = yaml.load(f, Loader=_SafeLoader) or {}
 
     content_root_rel = raw.get('content', {}).get('root', '../content')
     content_root = Path(content_root_rel).resolve()
@@ -43,7 +51,7 @@ class NodeConfig:
       raise FileNotFoundError(f"Content root meta file not found: {meta_path}")
 
     with meta_path.open("r", encoding="utf-8") as f:
-      meta_raw = yaml.safe_load(f) or {}
+      meta_raw = yaml.load(f, Loader=_SafeLoader) or {}
 
     root_content_path = meta_raw.get('root_content_path')
     if not root_content_path:
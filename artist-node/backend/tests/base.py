@@ -1,8 +1,8 @@
 """
 Base test class providing shared fixtures and utilities for all tests.
 """
-import json
-import pytest_asyncio
+import pickle
+import pytest
 from pathlib import Path
 from quart import Quart
 
@@ -11,6 +11,79 @@ from backend.graph.graph_ops import GraphOps
 from backend.app import create_app
 
 
+# Loaded graphs shared across every test class in the session, keyed by
+# fixture path. The graph is read-only in tests, so one instance serves
+# all classes; a test that needs to mutate should build its own copy.
+_GRAPH_CACHE: dict = {}
+
+# Nav configs handed to GraphOps, built once - tests and GraphOps only
+# read them. The two variants are identical today; fork the literal if
+# they ever need to diverge.
+_NAV_CONFIG_BASIC: dict = {
+  "items": [
+    {"label": "Home", "ref": "."},
+    {"label": "Artists", "ref": "artists", "auto_children": "from_subpages"},
+    {"label": "Releases", "ref": "server/pages/releases"},
+    {"label": "Store", "ref": "server/pages/store"},
+  ]
+}
+_NAV_CONFIG_WITH_PAGES: dict = _NAV_CONFIG_BASIC
+
+# Built apps shared across the session, keyed by (graph, nav config)
+# identity. GraphOps and create_app (blueprint registration, route
+# compilation) dominate client-fixture setup; the endpoints are
+# read-only GETs, so one app instance can serve every test. Only the
+# test client itself is created per test.
+_APP_CACHE: dict = {}
+
+
+def _shared_app(graph: ContentGraph, nav_config: dict) -> Quart:
+  """Return the session-shared app for this graph + nav config pair."""
+  key = (id(graph), id(nav_config))
+  app = _APP_CACHE.get(key)
+  if app is None:
+    graph_ops = GraphOps.from_graph(graph, nav_config=nav_config)
+    app = create_app(graph_ops)
+    app.config.update(TESTING=True)
+    # Warmup: the router compiles its rules lazily on first match, which
+    # would otherwise land on whichever test runs first. One throwaway
+    # match here keeps per-test timings uniform.
+    try:
+      app.url_map.bind("localhost").match("/api/nav", method="GET")
+    except Exception:
+      pass
+    _APP_CACHE[key] = app
+  return app
+
+
+def _load_graph(fixture_path: Path) -> ContentGraph:
+  """
+  Load the fixture graph, going through a pickle sidecar when it is
+  fresh - unpickling the prebuilt dataclass tree skips JSON parsing and
+  block dispatch entirely. The sidecar rebuilds automatically whenever
+  the JSON fixture is newer, and any load problem falls back to JSON.
+  """
+  pkl_path = fixture_path.with_suffix(".pkl")
+  try:
+    if pkl_path.stat().st_mtime >= fixture_path.stat().st_mtime:
+      graph = pickle.loads(pkl_path.read_bytes())
+      # Probe a node: sidecars written before a model-shape change (new
+      # slots, renamed fields) unpickle fine but break on first access.
+      for node in graph.nodes.values():
+        node.content_types
+        break
+      return graph
+  except Exception:
+    pass
+
+  graph = ContentGraph.from_json_file(fixture_path)
+  try:
+    pkl_path.write_bytes(pickle.dumps(graph, protocol=pickle.HIGHEST_PROTOCOL))
+  except OSError:
+    pass  # read-only checkout; caching is best-effort
+  return graph
+
+
 class ContentGraphTestBase:
   """
   Base class for tests that need access to the content graph fixture.
@@ -24,50 +97,37 @@ class ContentGraphTestBase:
   
   @classmethod
   def setup_class(cls):
-    """Load the content graph fixture once per test class."""
+    """Attach the (session-shared) content graph fixture to the class."""
     fixture_path = Path('backend/tests/resources/content_graph_test.json')
-    
-    with fixture_path.open('r') as f:
-      content_graph_data = json.load(f)
-    
-    cls.graph = ContentGraph.from_dict(content_graph_data)
+
+    key = str(fixture_path)
+    graph = _GRAPH_CACHE.get(key)
+    if graph is None:
+      graph = _load_graph(fixture_path)
+      _GRAPH_CACHE[key] = graph
+    cls.graph = graph
   
-  @pytest_asyncio.fixture
+  @pytest.fixture
   async def client(self):
     """
     Quart test client fixture for functional tests.
     
-    Creates a test app with the shared content graph and basic nav config.
-    Override this in subclasses if you need custom nav config or app setup.
+    Reuses the session-shared app built from the shared content graph
+    and basic nav config. Override this in subclasses if you need custom
+    nav config or app setup.
     """
-    graph_ops = GraphOps.from_graph(self.graph, nav_config=self.get_nav_config_basic())
-    app: Quart = create_app(graph_ops)
-    app.config.update(TESTING=True)
+    app = _shared_app(self.graph, self.get_nav_config_basic())
 
     async with app.test_client() as test_client:
       yield test_client
   
   @staticmethod
   def get_nav_config_basic() -> dict:
-    """Basic navigation config for testing."""
-    return {
-      "items": [
-        {"label": "Home", "ref": "."},
-        {"label": "Artists", "ref": "artists", "auto_children": "from_subpages"},
-        {"label": "Releases", "ref": "server/pages/releases"},
-        {"label": "Store", "ref": "server/pages/store"},
-      ]
-    }
-  
+    """Basic navigation config for testing (shared, treat as read-only)."""
+    return _NAV_CONFIG_BASIC
+
   @staticmethod
   def get_nav_config_with_pages() -> dict:
-    """Navigation config with additional page references."""
-    return {
-      "items": [
-        {"label": "Home", "ref": "."},
-        {"label": "Artists", "ref": "artists", "auto_children": "from_subpages"},
-        {"label": "Releases", "ref": "server/pages/releases"},
-        {"label": "Store", "ref": "server/pages/store"},
-      ]
-    }
+    """Navigation config with additional page references (shared, treat as read-only)."""
+    return _NAV_CONFIG_WITH_PAGES
 
@@ -1,5 +1,3 @@
-import pytest
-
 from backend.tests.base import ContentGraphTestBase
 
 
@@ -7,7 +5,6 @@ class TestPageController(ContentGraphTestBase):
   """Test page controller endpoints."""
 
 
-  @pytest.mark.asyncio
   async def test_page_endpoint_returns_root_when_no_path(self, client):
     resp = await client.get("/api/page")
     assert resp.status_code == 200
@@ -19,13 +16,11 @@ class TestPageController(ContentGraphTestBase):
     assert data["content"][0]["type"] == "hero"
 
 
-  @pytest.mark.asyncio
   async def test_page_endpoint_returns_artist_page(self, client):
     resp = await client.get("/api/page?path=artists/zol")
     assert resp.status_code == 200
 
     data = await resp.get_json()
-    print(data)
     assert data["path"] == "artists/zol"
     # assert data["title"] == "ZØL"
     assert isinstance(data["content"], list)
@@ -39,7 +34,6 @@ class TestPageController(ContentGraphTestBase):
     assert sub["type"] == "subpage"
     assert sub["ref"] == "artists/zol/tracks"
 
-  @pytest.mark.asyncio
   async def test_page_endpoint_404_for_unknown_path(self, client):
     resp = await client.get("/api/page?path=does/not/exist")
     assert resp.status_code == 404
@@ -1,38 +1,46 @@
+import pytest
+
 from backend.models.node import ContentNode
 from backend.models.blocks import HeroBlock, SectionBlock, SubpageBlock
 from backend.graph.graph_ops import GraphOps
 from backend.tests.base import ContentGraphTestBase
 
+# Fixture paths both structural tests inspect.
+_NODE_PATHS = ("server", "artists", "artists/zol", "artists/zol/tracks")
+
 
 class TestContentGraphFromDict(ContentGraphTestBase):
   """Test ContentGraph deserialization and structure."""
-  
-  def test_graph_structure(self):
+
+  @pytest.fixture(scope="class")
+  @classmethod
+  def nodes(cls):
+    """The fixture nodes under test, looked up once and shared by the
+    class; existence is asserted here so each test can index directly."""
+    nodes = {p: cls.graph.get_node(p) for p in _NODE_PATHS}
+    assert all(nodes.values())
+    return nodes
+
+  def test_graph_structure(self, nodes):
     """Test that the graph has the expected structure and node types."""
     assert self.graph is not None
     assert self.graph.root_content_path == "server"
 
-    # Assert all nodes exist as expected
-    server_node = self.graph.get_node("server")
-    artists_node = self.graph.get_node("artists")
-    zol_node = self.graph.get_node("artists/zol")
-    zol_tracks_node = self.graph.get_node("artists/zol/tracks")
-
     # All nodes should exist and be of type ContentNode
-    for node in (server_node, artists_node, zol_node, zol_tracks_node):
+    for node in nodes.values():
       assert isinstance(node, ContentNode)
 
     # Quick meta checks
-    assert server_node.meta.layout == "server"
-    assert artists_node.meta.layout == "artists"
-    assert zol_node.meta.layout == "artist"
-    assert zol_tracks_node.meta.layout == "tracks"
+    assert nodes["server"].meta.layout == "server"
+    assert nodes["artists"].meta.layout == "artists"
+    assert nodes["artists/zol"].meta.layout == "artist"
+    assert nodes["artists/zol/tracks"].meta.layout == "tracks"
 
-  def test_content_blocks(self):
+  def test_content_blocks(self, nodes):
     """Test that content blocks are properly deserialized."""
-    server_node = self.graph.get_node("server")
-    artists_node = self.graph.get_node("artists")
-    zol_node = self.graph.get_node("artists/zol")
+    server_node = nodes["server"]
+    artists_node = nodes["artists"]
+    zol_node = nodes["artists/zol"]
 
     # Server node content structure
     assert isinstance(server_node.content, list)
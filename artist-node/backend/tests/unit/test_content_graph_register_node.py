@@ -0,0 +1,78 @@
+from pathlib import Path
+
+import pytest
+
+from backend.models.blocks import CollectionBlock
+from backend.models.content_graph import ContentGraph
+from backend.models.node import ContentNode, NodeMeta, NodePreview
+
+_FIXTURE_PATH = Path('backend/tests/resources/content_graph_test.json')
+
+
+def _make_node(path: str, title: str) -> ContentNode:
+  parent, _, _ = path.rpartition("/")
+  return ContentNode(
+    meta=NodeMeta(path=path, parent_path=parent or None, layout="artist"),
+    title=title,
+    preview=NodePreview(title=title),
+  )
+
+
+class TestRegisterNode:
+  """Test incremental node registration on an already-indexed graph."""
+
+  @pytest.fixture
+  def graph(self):
+    """A private graph instance - register_node mutates indexes, so the
+    session-shared fixture from ContentGraphTestBase is off limits."""
+    return ContentGraph.from_json_file(_FIXTURE_PATH)
+
+  def test_register_appends_to_frozen_children(self, graph):
+    """_build_indexes freezes children entries to tuples; registering
+    under such a parent must extend the entry, not blow up."""
+    before = graph.children_by_parent["artists"]
+    assert isinstance(before, tuple)
+
+    graph.register_node(_make_node("artists/newcomer", "Newcomer"))
+
+    after = graph.children_by_parent["artists"]
+    assert "artists/newcomer" in after
+    assert set(after) == set(before) | {"artists/newcomer"}
+    # Registering the same node twice must not duplicate the entry.
+    graph.register_node(_make_node("artists/newcomer", "Newcomer"))
+    assert list(graph.children_by_parent["artists"]).count("artists/newcomer") == 1
+
+  def test_register_invalidates_sorted_children(self, graph):
+    """Cached sort orders for the parent must be dropped on mutation."""
+    sorted_before = graph.sorted_children("artists", "name_asc")
+    assert "artists/aaa-first" not in sorted_before
+
+    graph.register_node(_make_node("artists/aaa-first", "AAA First"))
+
+    sorted_after = graph.sorted_children("artists", "name_asc")
+    assert sorted_after[0] == "artists/aaa-first"
+
+  def test_register_invalidates_hydrated_collections(self, graph):
+    """The resolver's hydrated-collection cache is keyed on block
+    identity, so it survives payload-cache clears; registration must
+    drop it too or /api/page and /api/collection disagree."""
+    node = graph.get_node("artists")
+    node.content.append(CollectionBlock(source="folder", path="artists"))
+
+    before = graph.to_page_payload("artists")
+    assert len(before["content"][-1]["items"]) == 2
+
+    graph.register_node(_make_node("artists/newcomer", "Newcomer"))
+
+    after = graph.to_page_payload("artists")
+    paths = {item["path"] for item in after["content"][-1]["items"]}
+    assert "artists/newcomer" in paths
+
+  def test_register_under_new_parent(self, graph):
+    """A parent with no existing children index gets a fresh entry."""
+    graph.register_node(_make_node("artists/newcomer", "Newcomer"))
+    graph.register_node(_make_node("artists/newcomer/debut", "Debut"))
+
+    assert graph.children_by_parent["artists/newcomer"] == ("artists/newcomer/debut",)
+    assert graph.ancestor_chain["artists/newcomer/debut"] == [
+      "artists/newcomer/debut", "artists/newcomer", "artists"]
@@ -2,20 +2,36 @@
 from __future__ import annotations
 
 import os
+import pickle
+import sys
 import yaml
 import json
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from dataclasses import asdict
 
+# libyaml's C parser is ~10x faster on the many small YAML files a graph
+# build chews through; fall back to the pure-Python loader when PyYAML
+# was built without it.
+try:
+  from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+  from yaml import SafeLoader as _SafeLoader
 
+
+@lru_cache(maxsize=8192)
 def normalize_media_path(path_str: Optional[str]) -> Optional[str]:
   """
   Normalize media paths so the frontend can resolve them:
   - Convert Windows backslashes to forward slashes
   - Ensure a leading slash for site-root relative assets
   - Leave full URLs (http/https) untouched
+
+  Pure string-in/string-out, and layout-level assets repeat across many
+  nodes, so repeats collapse to one cache lookup.
   """
   if not path_str:
     return path_str
@@ -51,11 +67,15 @@ from backend.models.blocks import (
 )
 
 def load_yaml(path: Path) -> Dict[str, Any]:
-  if not path.exists():
+  # read_bytes instead of text-mode open: no TextIOWrapper/decode pass
+  # (the YAML parser decodes anyway), and catching FileNotFoundError
+  # replaces the separate exists() stat. Worth it across many tiny files.
+  try:
+    raw = path.read_bytes()
+  except FileNotFoundError:
     return {}
 
-  with open(path, 'r', encoding='utf-8') as f:
-    data = yaml.safe_load(f) or {}
+  data = yaml.load(raw, Loader=_SafeLoader) or {}
   if not isinstance(data, dict):
     raise ValueError(f"Expected mapping at path, got {type(data)} instead")
   return data
@@ -66,187 +86,257 @@ def infer_layout_from_path(path_str: str) -> str:
   """
   # NOTE - CJD - This is intentionally simple for now
 
-  parts = path_str.split("/")
-
   if path_str == "server":
     return "server"
 
-  if len(parts) >= 2 and parts[0] == "artists" and len(parts) == 2:
+  # Split once; the marker checks share one set so each membership test
+  # is a hash probe instead of a list scan.
+  parts = path_str.split("/")
+
+  if len(parts) == 2 and parts[0] == "artists":
     # e.g. artists/zol
     return "artist"
 
-  if "albums" in parts:
+  markers = set(parts)
+
+  if "albums" in markers:
     return "album"
 
-  if "tracks" in parts:
+  if "tracks" in markers:
     return "track"
 
-  if "sets" in parts:
+  if "sets" in markers:
     return "set"
 
   # generic catch all if we can't infer a more specific layout
   return "page"
 
-def parse_block(raw: Dict[str, Any]) -> Block:
-  block_type = raw.get("type")
-
-  if block_type == "hero":
-    # Parse sigil config if present
-    sigil_raw = raw.get("sigil")
-    sigil = None
-    if sigil_raw:
-      sigil = SigilConfig(
-        type=sigil_raw.get("type", "p5"),
-        id=sigil_raw.get("id"),
-        src=sigil_raw.get("src"),
-        alt=sigil_raw.get("alt"),
-        options=sigil_raw.get("options"),
-      )
-    
-    return HeroBlock(
-      heading=raw.get("heading", ""),
-      subheading=raw.get("subheading", ""),
-      body=raw.get("body", ""),
-      cta=raw.get("cta", ""),
-      sigil=sigil,
-      background=normalize_media_path(raw.get("background")),
+def _parse_hero(raw: Dict[str, Any]) -> HeroBlock:
+  # Parse sigil config if present
+  sigil_raw = raw.get("sigil")
+  sigil = None
+  if sigil_raw:
+    sigil = SigilConfig(
+      type=sigil_raw.get("type", "p5"),
+      id=sigil_raw.get("id"),
+      src=sigil_raw.get("src"),
+      alt=sigil_raw.get("alt"),
+      options=sigil_raw.get("options"),
     )
 
-  if block_type == "section":
-    child_blocks = [parse_block(b) for b in raw.get("blocks", []) or []]
-    return SectionBlock(
-      id=raw.get("id"),
-      label=raw.get("label", ""),
-      blocks=child_blocks,
-      align=raw.get("align"),
-    )
+  return HeroBlock(
+    heading=raw.get("heading", ""),
+    subheading=raw.get("subheading", ""),
+    body=raw.get("body", ""),
+    cta=raw.get("cta", ""),
+    sigil=sigil,
+    background=normalize_media_path(raw.get("background")),
+  )
+
+
+def _parse_section(raw: Dict[str, Any]) -> SectionBlock:
+  child_blocks = [parse_block(b) for b in raw.get("blocks", []) or []]
+  return SectionBlock(
+    id=raw.get("id"),
+    label=raw.get("label", ""),
+    blocks=child_blocks,
+    align=raw.get("align"),
+  )
 
-  if block_type == "markdown":
-    return MarkdownBlock(body=raw.get("body", ""))
 
-  if block_type == "subpage":
-    return SubpageBlock(
-      ref=raw.get("ref"),
-      label=raw.get("label"),
-      nav=raw.get("nav", False)
+def _parse_markdown(raw: Dict[str, Any]) -> MarkdownBlock:
+  return MarkdownBlock(body=raw.get("body", ""))
+
+
+def _parse_subpage(raw: Dict[str, Any]) -> SubpageBlock:
+  ref = raw.get("ref")
+  return SubpageBlock(
+    # Refs repeat as node paths all over the graph; interning matches
+    # what NodeMeta does for paths
+    ref=sys.intern(ref) if ref else ref,
+    label=raw.get("label"),
+    nav=raw.get("nav", False)
+  )
+
+
+def _parse_collection(raw: Dict[str, Any]) -> CollectionBlock:
+  # Parse layout config if present
+  layout_raw = raw.get("layout")
+  layout = None
+  if layout_raw:
+    layout = CollectionLayout(
+      mode=layout_raw.get("mode", "grid"),
+      # Grid-specific
+      columns=layout_raw.get("columns"),
+      gap=layout_raw.get("gap"),
+      align=layout_raw.get("align"),
+      max_rows=layout_raw.get("max_rows"),
+      pagination=layout_raw.get("pagination"),
+      # List-specific
+      dense=layout_raw.get("dense"),
+      show_dividers=layout_raw.get("show_dividers"),
+      show_avatar=layout_raw.get("show_avatar"),
+      show_meta=layout_raw.get("show_meta"),
+      max_items=layout_raw.get("max_items"),
+      # Carousel-specific
+      slides_per_view=layout_raw.get("slides_per_view"),
+      spacing=layout_raw.get("spacing"),
+      loop=layout_raw.get("loop"),
+      autoplay=layout_raw.get("autoplay"),
+      controls=layout_raw.get("controls"),
+      snap_align=layout_raw.get("snap_align"),
+      max_width=layout_raw.get("max_width"),
     )
 
-  if block_type == "collection":
-    # Parse layout config if present
-    layout_raw = raw.get("layout")
-    layout = None
-    if layout_raw:
-      layout = CollectionLayout(
-        mode=layout_raw.get("mode", "grid"),
-        # Grid-specific
-        columns=layout_raw.get("columns"),
-        gap=layout_raw.get("gap"),
-        align=layout_raw.get("align"),
-        max_rows=layout_raw.get("max_rows"),
-        pagination=layout_raw.get("pagination"),
-        # List-specific
-        dense=layout_raw.get("dense"),
-        show_dividers=layout_raw.get("show_dividers"),
-        show_avatar=layout_raw.get("show_avatar"),
-        show_meta=layout_raw.get("show_meta"),
-        max_items=layout_raw.get("max_items"),
-        # Carousel-specific
-        slides_per_view=layout_raw.get("slides_per_view"),
-        spacing=layout_raw.get("spacing"),
-        loop=layout_raw.get("loop"),
-        autoplay=layout_raw.get("autoplay"),
-        controls=layout_raw.get("controls"),
-        snap_align=layout_raw.get("snap_align"),
-        max_width=layout_raw.get("max_width"),
-      )
-    
-    # Parse paging config if present
-    paging_raw = raw.get("paging")
-    paging = None
-    if paging_raw:
-      paging = CollectionPaging(
-        enabled=paging_raw.get("enabled", False),
-        page_size=paging_raw.get("page_size"),
-        mode=paging_raw.get("mode", "load_more"),
-      )
-    
-    return CollectionBlock(
-      source=raw.get("source", "folder"),
-      path=raw.get("path"),
-      layout=layout,
-      card=raw.get("card"),
-      sort=raw.get("sort"),
-      sort_options=raw.get("sort_options"),
-      limit=raw.get("limit"),
-      filters=raw.get("filters"),
-      paging=paging,
-      empty_state=raw.get("empty_state"),
+  # Parse paging config if present
+  paging_raw = raw.get("paging")
+  paging = None
+  if paging_raw:
+    paging = CollectionPaging(
+      enabled=paging_raw.get("enabled", False),
+      page_size=paging_raw.get("page_size"),
+      mode=paging_raw.get("mode", "load_more"),
     )
 
-  if block_type == "audio_player":
-    # Parse visualizer config if present
-    visualizer_raw = raw.get("visualizer")
-    visualizer = None
-    if visualizer_raw:
-      visualizer = VisualizerConfig(
-        type=visualizer_raw.get("type", "p5"),
-        id=visualizer_raw.get("id", "spectrum-bars"),
-        options=visualizer_raw.get("options"),
-      )
-    
-    return AudioPlayerBlock(
-      src=raw.get("src", ""),
-      title=raw.get("title"),
-      artist=raw.get("artist"),
-      artwork=raw.get("artwork"),
-      visualizer=visualizer,
+  path = raw.get("path")
+  return CollectionBlock(
+    # Low-cardinality / path strings, interned like the load-side builder
+    source=sys.intern(raw.get("source", "folder")),
+    path=sys.intern(path) if path else path,
+    layout=layout,
+    card=raw.get("card"),
+    sort=raw.get("sort"),
+    sort_options=raw.get("sort_options"),
+    limit=raw.get("limit"),
+    filters=raw.get("filters"),
+    paging=paging,
+    empty_state=raw.get("empty_state"),
+  )
+
+
+def _parse_audio_player(raw: Dict[str, Any]) -> AudioPlayerBlock:
+  # Parse visualizer config if present
+  visualizer_raw = raw.get("visualizer")
+  visualizer = None
+  if visualizer_raw:
+    visualizer = VisualizerConfig(
+      type=visualizer_raw.get("type", "p5"),
+      id=visualizer_raw.get("id", "spectrum-bars"),
+      options=visualizer_raw.get("options"),
     )
 
-  return MarkdownBlock(body=f"Unknown block type: {block_type}")
+  return AudioPlayerBlock(
+    src=raw.get("src", ""),
+    title=raw.get("title"),
+    artist=raw.get("artist"),
+    artwork=raw.get("artwork"),
+    visualizer=visualizer,
+  )
+
+
+def _parse_unknown(raw: Dict[str, Any]) -> MarkdownBlock:
+  return MarkdownBlock(body=f"Unknown block type: {raw.get('type')}")
+
+
+# One parser per block type; parse_block dispatches through this table
+# in O(1) instead of re-walking an if/elif ladder per block. Mirrors
+# _BLOCK_BUILDERS in backend.models.content_graph.
+_BLOCK_PARSERS = {
+  "hero": _parse_hero,
+  "section": _parse_section,
+  "markdown": _parse_markdown,
+  "subpage": _parse_subpage,
+  "collection": _parse_collection,
+  "audio_player": _parse_audio_player,
+}
+
+
+def parse_block(raw: Dict[str, Any]) -> Block:
+  return _BLOCK_PARSERS.get(raw.get("type"), _parse_unknown)(raw)
+
+
+def _load_node_yaml(node_dir: Path) -> tuple[Dict[str, Any], Dict[str, Any]]:
+  """
+  Parse a node's index.yaml and _meta.yaml in one load_all pass.
+
+  Joining the two small files with a document separator costs one
+  parser/scanner setup per node instead of two. Missing or empty files
+  contribute an explicit null document so the positions stay fixed: a
+  well-formed fusion always yields exactly three documents (index, meta,
+  and the null from the final separator). Any other shape means a file
+  carried its own "---" and shifted the positions, so fall back to
+  parsing the files separately - load_yaml then raises on a multi-doc
+  file the same way plain safe_load always did.
+  """
+  index_path = node_dir / "index.yaml"
+  meta_path = node_dir / "_meta.yaml"
+  raw = b""
+  for path in (index_path, meta_path):
+    try:
+      part = path.read_bytes()
+    except FileNotFoundError:
+      part = b""
+    raw += (part.strip() or b"null") + b"\n---\n"
+
+  docs = list(yaml.load_all(raw, Loader=_SafeLoader))
+  if len(docs) != 3 or docs[2] is not None:
+    return load_yaml(index_path), load_yaml(meta_path)
+
+  index_data = docs[0] or {}
+  folder_meta = docs[1] or {}
+  for data in (index_data, folder_meta):
+    if not isinstance(data, dict):
+      raise ValueError(f"Expected mapping in {node_dir}, got {type(data)} instead")
+  return index_data, folder_meta
 
 
 def build_node_from_directory(node_dir: Path, content_root: Path) -> ContentNode:
   """
   Given a directory that contains an index.yaml, construct a ContentNode.
   """
-  # 1. Compute relative path and parent path
-  rel_path = node_dir.relative_to(content_root)
+  # 1. Compute relative path and parent path by string slicing -
+  # node_dir is always under content_root, so relative_to/.parent/
+  # .as_posix would allocate several Path objects per node for what two
+  # slices give us.
+  rel = str(node_dir)[len(str(content_root)) + 1:].replace(os.sep, "/")
 
-  if rel_path == Path("."):
+  if not rel:
     path_str = ""
     parent_path = ""
   else:
-    path_str = rel_path.as_posix()
-    parent_rel = rel_path.parent
-    parent_path = None if parent_rel == Path(".") else parent_rel.as_posix()
-
-  # 2. Load index.yaml data
-  index_data = load_yaml(node_dir / "index.yaml")
+    path_str = rel
+    i = rel.rfind("/")
+    parent_path = None if i < 0 else rel[:i]
 
-  title = index_data.get("title")
-  tagline = index_data.get("tagline")
-  background = normalize_media_path(index_data.get("background"))  # page-level background image
+  # 2+3. Load index.yaml and _meta.yaml in one parse pass.
+  # Bound .get methods hoisted once - this function runs per node and
+  # each dotted lookup below would re-resolve the method.
+  index_data, folder_meta = _load_node_yaml(node_dir)
+  ig = index_data.get
+  fg = folder_meta.get
 
-  # 3. Load _meta.yaml data
-  folder_meta = load_yaml(node_dir / "_meta.yaml")
+  title = ig("title")
+  tagline = ig("tagline")
+  background = normalize_media_path(ig("background"))  # page-level background image
 
-  # 4. Determine layout
-  layout = folder_meta.get("layout", infer_layout_from_path(path_str))
+  # 4. Determine layout (only infer when _meta.yaml doesn't name one -
+  # passing the inference as a get() default would run it every time)
+  layout = fg("layout") or infer_layout_from_path(path_str)
 
   # 5. Construct NodeMeta
   meta = NodeMeta(
     path = path_str or "server",
     parent_path = parent_path,
     layout = layout,
-    slug = folder_meta.get("slug"),
-    display_name = folder_meta.get("display_name"),
-    theme = folder_meta.get("theme"),  # per-node theme override
-    effects = folder_meta.get("effects", []),  # visual FX layers: ["crt", "chroma", "glow"]
+    slug = fg("slug"),
+    display_name = fg("display_name"),
+    theme = fg("theme"),  # per-node theme override
+    effects = fg("effects", []),  # visual FX layers: ["crt", "chroma", "glow"]
     # NOTE - CJD - Extra is intentionally not used for now, decide later if we want to handle random user defined attributes
   )
 
   # 6. Construct NodePreview
-  preview_data = index_data.get("preview", {})
+  preview_data = ig("preview", {})
   preview: Optional[NodePreview] = None
 
   if preview_data:
@@ -259,7 +349,7 @@ def build_node_from_directory(node_dir: Path, content_root: Path) -> ContentNode
     )
 
   # 7. Construct content blocks
-  raw_blocks: List[Dict[str, Any]] = index_data.get("content", [])
+  raw_blocks: List[Dict[str, Any]] = ig("content", [])
   content_blocks: List[Block] = [parse_block(b) for b in raw_blocks]
 
   # 8. Return the ContentNode
@@ -272,6 +362,72 @@ def build_node_from_directory(node_dir: Path, content_root: Path) -> ContentNode
     content=content_blocks,
   )
 
+def _iter_node_dirs(root: str):
+  """
+  Yield directories under root that contain an index.yaml, depth-first.
+
+  One scandir pass per directory: DirEntry type checks reuse the stat
+  data from the directory read, so this skips the extra stat calls and
+  name-list shuffling os.walk does per entry.
+  """
+  subdirs: List[str] = []
+  has_index = False
+  with os.scandir(root) as it:
+    for entry in it:
+      if entry.is_dir(follow_symlinks=False):
+        subdirs.append(entry.path)
+      elif not has_index and entry.name == "index.yaml":
+        has_index = True
+  if has_index:
+    yield root
+  for sub in subdirs:
+    yield from _iter_node_dirs(sub)
+
+
+# Pickle cache for warm rebuilds: the graph only changes when content
+# YAML changes, so the cache is keyed on the newest YAML mtime under the
+# content root. Pickle round-trips the dataclass tree far faster than
+# re-parsing YAML and rebuilding nodes.
+_GRAPH_PICKLE = "content_graph.pkl"
+_GRAPH_PICKLE_META = "content_graph.pkl.meta"
+
+
+def _content_signature(root: str) -> int:
+  """Newest st_mtime_ns over every .yaml file under root (scandir walk)."""
+  sig = 0
+  with os.scandir(root) as it:
+    for entry in it:
+      if entry.is_dir(follow_symlinks=False):
+        sub = _content_signature(entry.path)
+        if sub > sig:
+          sig = sub
+      elif entry.name.endswith(".yaml"):
+        mtime = entry.stat(follow_symlinks=False).st_mtime_ns
+        if mtime > sig:
+          sig = mtime
+  return sig
+
+
+def _load_cached_graph(cache_dir: Path, sig: int) -> Optional[ContentGraph]:
+  try:
+    if (cache_dir / _GRAPH_PICKLE_META).read_text().strip() != str(sig):
+      return None
+    return pickle.loads((cache_dir / _GRAPH_PICKLE).read_bytes())
+  except Exception:
+    return None  # missing/stale/unreadable cache - rebuild
+
+
+def _write_cached_graph(cache_dir: Path, graph: ContentGraph, sig: int) -> None:
+  try:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    (cache_dir / _GRAPH_PICKLE).write_bytes(
+      pickle.dumps(graph, protocol=pickle.HIGHEST_PROTOCOL)
+    )
+    (cache_dir / _GRAPH_PICKLE_META).write_text(str(sig))
+  except OSError:
+    pass  # caching is best-effort
+
+
 # ------ Graph Builder -------
 def load_content_root_meta(content_root: Path) -> Dict[str, Any]:
   """
@@ -280,12 +436,23 @@ def load_content_root_meta(content_root: Path) -> Dict[str, Any]:
   """
   return load_yaml(content_root / "_meta.yaml")
 
-def build_content_graph(content_root: Path) -> ContentGraph:
+def build_content_graph(content_root: Path, cache_dir: Optional[Path] = None) -> ContentGraph:
   """
   Walk the content/ tree, build a ContentGraph from all the folders that contain an index.yaml
+
+  When cache_dir is given, a pickled graph keyed on the newest content
+  YAML mtime is reused across runs, skipping the whole walk/parse/build
+  on warm starts.
   """
   content_root = content_root.resolve()
 
+  #0 Warm-start: reuse the pickled graph when no YAML changed
+  sig = _content_signature(str(content_root)) if cache_dir is not None else 0
+  if cache_dir is not None:
+    cached = _load_cached_graph(cache_dir, sig)
+    if cached is not None:
+      return cached
+
   #1 Global content meta
   root_meta = load_content_root_meta(content_root)
   root_content_path = root_meta.get("root_content", "server")  # e.g 'server' or 'artists/zol'
@@ -293,45 +460,73 @@ def build_content_graph(content_root: Path) -> ContentGraph:
 
   graph = ContentGraph(root_content_path=root_content_path, root_theme=root_theme)
 
-  #2 recursively walk directories
-  for dirpath, dirnames, filenames in os.walk(content_root):
-    dir_path = Path(dirpath)
-
-    # Only treat directories that contain an index.yaml as nodes
-    if "index.yaml" not in filenames:
-      continue
-
-    node = build_node_from_directory(dir_path, content_root)
-    graph.register_node(node)
+  #2 recursively walk directories, collecting node dirs up front
+  # Only directories that contain an index.yaml count as nodes
+  node_dirs = [Path(d) for d in _iter_node_dirs(str(content_root))]
 
-  #3 Optionally compute additional indexes (artists, albums, tracks) here
-  _build_additional_indexes(graph)
+  # Each node build is two file reads plus YAML parsing and is fully
+  # independent, so large trees fan out across a process pool (the YAML
+  # parse holds the GIL, so threads wouldn't help). Small trees skip the
+  # pool - worker spawn costs more than it saves.
+  if len(node_dirs) <= 64:
+    nodes = [build_node_from_directory(d, content_root) for d in node_dirs]
+  else:
+    with ProcessPoolExecutor() as executor:
+      nodes = list(executor.map(
+        partial(build_node_from_directory, content_root=content_root),
+        node_dirs,
+        chunksize=16,
+      ))
+
+  # Bulk registration: plain dict inserts, then every derived index -
+  # children, artist/album/track rollups, hrefs, ancestor chains - in one
+  # pass, the same way ContentGraph.from_dict loads. Per-node
+  # register_node would re-clear caches and bisect the depth order on
+  # every insert for nothing; it stays for one-off runtime registration.
+  for node in nodes:
+    graph.nodes[node.meta.path] = node
+  graph._build_indexes()
+
+  if cache_dir is not None:
+    _write_cached_graph(cache_dir, graph, sig)
 
   return graph
 
-def _build_additional_indexes(graph: ContentGraph) -> None:
-  """
-  Place holder for extra passes over the graph to compute:
-  - graph.artists
-  - graph.albums_by_artist
-  - graph.tracks_by_album etc
+def write_python_module(graph_dict: Dict[str, Any], nav_data: Dict[str, Any], out_path: Path) -> None:
   """
+  Emit the built graph + nav config as a Python literal module.
 
-  for path, node in graph.nodes.items():
-    parts = path.split("/")
-
-  if len(parts) >= 2 and parts[0] == "artists":
-    graph.artists.append(path)
+  Importing the generated module costs one marshal load of the cached .pyc
+  instead of re-parsing JSON/YAML text on every server start.
+  """
+  with open(out_path, "w", encoding="utf-8") as f:
+    f.write("# Generated by scripts/builder.py - do not edit.\n")
+    f.write(f"CONTENT_GRAPH = {graph_dict!r}\n")
+    f.write(f"NAV_CONFIG = {nav_data!r}\n")
 
 
 if __name__ == "__main__":
   # TODO - CJD - option to pass in content path here
   print("Building content graph...")
   content_root = Path("../content")
-  graph = build_content_graph(content_root)
+  graph = build_content_graph(content_root, cache_dir=Path("build"))
+  graph_dict = asdict(graph)
 
-  os.makedirs("build", exist_ok=True)
-  with open("build/content_graph.json", "w") as f:
-    json.dump(asdict(graph), f, indent=2)
+  nav_data = load_yaml(content_root / graph.root_content_path / "nav.yaml")
 
-  print(json.dumps(asdict(graph), indent=2))
\ No newline at end of file
+  os.makedirs("build", exist_ok=True)
+  # Encode once; the file write and the console dump reuse the bytes
+  # instead of re-walking the graph through the encoder twice. orjson
+  # serializes the dataclass tree natively (no asdict walk) and is much
+  # faster than the stdlib encoder; fall back when it isn't installed.
+  try:
+    import orjson
+    payload_bytes = orjson.dumps(graph, option=orjson.OPT_INDENT_2)
+  except ImportError:
+    payload_bytes = json.dumps(graph_dict, indent=2).encode("utf-8")
+  with open("build/content_graph.json", "wb") as f:
+    f.write(payload_bytes)
+
+  write_python_module(graph_dict, nav_data, Path("build/content_graph_data.py"))
+
+  print(payload_bytes.decode("utf-8"))
\ No newline at end of file